@@ -783,8 +783,9 @@ class ApplicationController(IApplicationController):
     def get_available_models(self) -> Dict[str, List[str]]:
         """Get available AI models."""
         models = self.model_manager.list_available_models()
+        # Report sizes in their declared order; the per-type collections are unordered sets
         return {
-            model_type.value: [size.value for size in sizes]
+            model_type.value: [size.value for size in ModelSize if size in sizes]
             for model_type, sizes in models.items()
         }
     
@@ -6,7 +6,7 @@ must follow, ensuring consistent APIs across the application.
 """
 
 from abc import ABC, abstractmethod
-from typing import List, Dict, Optional, Callable, Any
+from typing import List, Dict, FrozenSet, Optional, Callable, Any
 from enum import Enum
 
 from ..models.data_models import (
@@ -108,7 +108,7 @@ class IModelManager(ABC):
         pass
     
     @abstractmethod
-    def list_available_models(self) -> Dict[ModelType, List[ModelSize]]:
+    def list_available_models(self) -> Dict[ModelType, FrozenSet[ModelSize]]:
         """List all locally available models."""
         pass
     
@@ -137,7 +137,7 @@ class ISubtitleGenerator(ABC):
         pass
     
     @abstractmethod
-    def export_json_alignment(self, alignment_data: AlignmentData) -> str:
+    def export_json_alignment(self, alignment_data: AlignmentData, indent: bool = False) -> str:
         """Export alignment data as JSON."""
         pass
     
@@ -6,21 +6,144 @@ supporting detailed alignment data export with proper encoding handling and vali
 """
 
 import json
+import numbers
+import time
 from typing import Dict, Any, List, Optional
-from datetime import datetime
 from ..models.data_models import AlignmentData, Segment, WordSegment
 
+try:
+    import msgspec
+except ImportError:  # msgspec is optional; the standard json module is used instead
+    msgspec = None
+
+
+def _json_default(value: Any) -> Any:
+    """
+    Convert numeric scalars json.dumps cannot encode, such as numpy.float32 scores.
+    
+    Args:
+        value: Object json.dumps could not serialize
+        
+    Returns:
+        Equivalent Python number
+        
+    Raises:
+        TypeError: If the value is not a numeric scalar
+    """
+    if isinstance(value, numbers.Number) and hasattr(value, "item"):
+        return value.item()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def _fast_iso_now() -> str:
+    """
+    Format the current UTC time as an ISO-8601 string with microsecond precision.
+    
+    Built from time.time_ns() with integer arithmetic, avoiding the datetime
+    object construction and isoformat() call on every export.
+    
+    Returns:
+        Timestamp string such as "2024-01-31T12:34:56.123456Z"
+    """
+    seconds, remainder_ns = divmod(time.time_ns(), 1_000_000_000)
+    t = time.gmtime(seconds)
+    return (f"{t.tm_year:04d}-{t.tm_mon:02d}-{t.tm_mday:02d}"
+            f"T{t.tm_hour:02d}:{t.tm_min:02d}:{t.tm_sec:02d}.{remainder_ns // 1000:06d}Z")
+
+
+# Decoding schema for parse_json_to_alignment_data; exports are always encoded with
+# json.dumps, which accepts numpy scalars via _json_default and keeps NaN as NaN
+if msgspec is not None:
+    class _SegmentRow(msgspec.Struct):
+        """Schema of a segment entry in exported alignment JSON."""
+        start_time: float
+        end_time: float
+        text: str
+        confidence: float = 1.0
+        segment_id: int = 0
+    
+    class _WordSegmentRow(msgspec.Struct):
+        """Schema of a word segment entry in exported alignment JSON."""
+        word: str
+        start_time: float
+        end_time: float
+        confidence: float = 1.0
+        segment_id: int = 0
+    
+    class _AudioInfo(msgspec.Struct):
+        """Schema of the audio section in exported alignment JSON."""
+        duration: float = 0.0
+        source_file: Optional[str] = ""
+    
+    class _AlignmentEnvelope(msgspec.Struct):
+        """Schema of an exported alignment JSON document."""
+        segments: List[_SegmentRow] = []
+        word_segments: List[_WordSegmentRow] = []
+        confidence_scores: List[float] = []
+        audio: _AudioInfo = msgspec.field(default_factory=_AudioInfo)
+
+
+def _to_milliseconds(seconds: float) -> int:
+    """
+    Quantize a time in seconds to whole milliseconds.
+    
+    Args:
+        seconds: Time in seconds
+        
+    Returns:
+        Time in integer milliseconds
+    """
+    return int(round(seconds * 1000))
+
+
+def _quantize_time(seconds: float) -> float:
+    """
+    Round a time in seconds to the millisecond precision used in exports.
+    
+    Args:
+        seconds: Time in seconds
+        
+    Returns:
+        Time in seconds, quantized to whole milliseconds
+    """
+    return _to_milliseconds(seconds) / 1000
+
+
+def _quantize_duration(start_time: float, end_time: float) -> float:
+    """
+    Compute a duration from millisecond-quantized start and end times.
+    
+    The result always equals the difference of the exported start and end times.
+    
+    Args:
+        start_time: Start time in seconds
+        end_time: End time in seconds
+        
+    Returns:
+        Duration in seconds, quantized to whole milliseconds
+    """
+    return (_to_milliseconds(end_time) - _to_milliseconds(start_time)) / 1000
+
 
 class JSONExporter:
     """Handles export of alignment data to JSON format."""
     
+    # Required fields checked by validate_json_content for each entry
+    _SEGMENT_TIMING_FIELDS = ("start_time", "end_time")
+    _WORD_SEGMENT_REQUIRED_FIELDS = ("word", "start_time", "end_time")
+    
     def __init__(self):
         """Initialize the JSON exporter."""
-        pass
+        # msgspec decoder, reused across imports when msgspec is installed
+        if msgspec is not None:
+            self._decoder = msgspec.json.Decoder(_AlignmentEnvelope)
+        else:
+            self._decoder = None
     
     def export_alignment_data(self, alignment_data: AlignmentData, 
                             include_metadata: bool = True,
-                            include_statistics: bool = True) -> str:
+                            include_statistics: bool = True,
+                            indent: bool = False) -> str:
         """
         Export complete alignment data to JSON format.
         
@@ -28,10 +151,34 @@ class JSONExporter:
             alignment_data: The alignment data to export
             include_metadata: Whether to include metadata information
             include_statistics: Whether to include statistical analysis
+            indent: Whether to pretty-print the JSON (compact by default)
             
         Returns:
             JSON formatted alignment data as string
             
+        Raises:
+            ValueError: If alignment data is invalid
+        """
+        json_data = self.build_alignment_payload(alignment_data, include_metadata, include_statistics)
+        return self._dumps(json_data, indent)
+    
+    def build_alignment_payload(self, alignment_data: AlignmentData,
+                                include_metadata: bool = True,
+                                include_statistics: bool = True) -> Dict[str, Any]:
+        """
+        Build the alignment data payload exported by export_alignment_data.
+        
+        Useful for callers that need the structure rather than a JSON string. A new
+        dictionary is built on every call, so callers may modify the result freely.
+        
+        Args:
+            alignment_data: The alignment data to export
+            include_metadata: Whether to include metadata information
+            include_statistics: Whether to include statistical analysis
+            
+        Returns:
+            Dictionary with the same structure as the exported JSON document
+            
         Raises:
             ValueError: If alignment data is invalid
         """
@@ -52,7 +199,7 @@ class JSONExporter:
         json_data["word_segments"] = [self._word_segment_to_dict(word_segment) for word_segment in alignment_data.word_segments]
         
         # Add confidence scores
-        json_data["confidence_scores"] = alignment_data.confidence_scores
+        json_data["confidence_scores"] = list(alignment_data.confidence_scores)
         
         # Add audio information
         json_data["audio"] = {
@@ -64,14 +211,30 @@ class JSONExporter:
         if include_statistics:
             json_data["statistics"] = self._generate_statistics(alignment_data)
         
-        return json.dumps(json_data, indent=2, ensure_ascii=False)
+        return json_data
     
-    def export_segments_only(self, alignment_data: AlignmentData) -> str:
+    def _dumps(self, data: Dict[str, Any], indent: bool = False) -> str:
+        """
+        Serialize data to JSON.
+        
+        Args:
+            data: The data to serialize
+            indent: Whether to pretty-print with two-space indentation
+            
+        Returns:
+            JSON formatted string with non-ASCII characters preserved
+        """
+        if indent:
+            return json.dumps(data, indent=2, ensure_ascii=False, default=_json_default)
+        return json.dumps(data, separators=(",", ":"), ensure_ascii=False, default=_json_default)
+    
+    def export_segments_only(self, alignment_data: AlignmentData, indent: bool = False) -> str:
         """
         Export only segment data to JSON format.
         
         Args:
             alignment_data: The alignment data containing segments
+            indent: Whether to pretty-print the JSON (compact by default)
             
         Returns:
             JSON formatted segments as string
@@ -88,14 +251,15 @@ class JSONExporter:
             "audio_duration": alignment_data.audio_duration
         }
         
-        return json.dumps(segments_data, indent=2, ensure_ascii=False)
+        return self._dumps(segments_data, indent)
     
-    def export_words_only(self, alignment_data: AlignmentData) -> str:
+    def export_words_only(self, alignment_data: AlignmentData, indent: bool = False) -> str:
         """
         Export only word segment data to JSON format.
         
         Args:
             alignment_data: The alignment data containing word segments
+            indent: Whether to pretty-print the JSON (compact by default)
             
         Returns:
             JSON formatted word segments as string
@@ -112,15 +276,17 @@ class JSONExporter:
             "audio_duration": alignment_data.audio_duration
         }
         
-        return json.dumps(words_data, indent=2, ensure_ascii=False)
+        return self._dumps(words_data, indent)
     
-    def export_subtitle_format(self, alignment_data: AlignmentData, format_type: str = "segments") -> str:
+    def export_subtitle_format(self, alignment_data: AlignmentData, format_type: str = "segments",
+                               indent: bool = False) -> str:
         """
         Export alignment data in a subtitle-friendly JSON format.
         
         Args:
             alignment_data: The alignment data to export
             format_type: Type of export ("segments", "words", or "both")
+            indent: Whether to pretty-print the JSON (compact by default)
             
         Returns:
             JSON formatted subtitle data as string
@@ -131,7 +297,9 @@ class JSONExporter:
         if not alignment_data:
             raise ValueError("Alignment data cannot be None")
         
-        if format_type not in ["segments", "words", "both"]:
+        try:
+            builder = self._SUBTITLE_FORMAT_BUILDERS[format_type]
+        except (KeyError, TypeError):
             raise ValueError("format_type must be 'segments', 'words', or 'both'")
         
         subtitle_data = {
@@ -140,42 +308,87 @@ class JSONExporter:
             "audio_duration": alignment_data.audio_duration,
             "source_file": alignment_data.source_file
         }
+        subtitle_data.update(builder(self, alignment_data))
         
-        if format_type in ["segments", "both"]:
-            subtitle_data["subtitles"] = []
-            for i, segment in enumerate(alignment_data.segments, 1):
-                subtitle_entry = {
-                    "id": i,
-                    "start": round(segment.start_time, 3),
-                    "end": round(segment.end_time, 3),
-                    "duration": round(segment.end_time - segment.start_time, 3),
-                    "text": segment.text,
-                    "confidence": round(segment.confidence, 3)
-                }
-                subtitle_data["subtitles"].append(subtitle_entry)
+        return self._dumps(subtitle_data, indent)
+    
+    def _build_segments_payload(self, alignment_data: AlignmentData) -> Dict[str, Any]:
+        """
+        Build the segment entries of the subtitle JSON format.
         
-        if format_type in ["words", "both"]:
-            subtitle_data["words"] = []
-            for i, word_segment in enumerate(alignment_data.word_segments, 1):
-                word_entry = {
-                    "id": i,
-                    "word": word_segment.word,
-                    "start": round(word_segment.start_time, 3),
-                    "end": round(word_segment.end_time, 3),
-                    "duration": round(word_segment.end_time - word_segment.start_time, 3),
-                    "confidence": round(word_segment.confidence, 3),
-                    "segment_id": word_segment.segment_id
-                }
-                subtitle_data["words"].append(word_entry)
+        Args:
+            alignment_data: The alignment data
+            
+        Returns:
+            Dictionary containing the "subtitles" list
+        """
+        subtitles = []
+        for i, segment in enumerate(alignment_data.segments, 1):
+            subtitle_entry = {
+                "id": i,
+                "start": _quantize_time(segment.start_time),
+                "end": _quantize_time(segment.end_time),
+                "duration": _quantize_duration(segment.start_time, segment.end_time),
+                "text": segment.text,
+                "confidence": round(segment.confidence, 3)
+            }
+            subtitles.append(subtitle_entry)
+        
+        return {"subtitles": subtitles}
+    
+    def _build_words_payload(self, alignment_data: AlignmentData) -> Dict[str, Any]:
+        """
+        Build the word entries of the subtitle JSON format.
+        
+        Args:
+            alignment_data: The alignment data
+            
+        Returns:
+            Dictionary containing the "words" list
+        """
+        words = []
+        for i, word_segment in enumerate(alignment_data.word_segments, 1):
+            word_entry = {
+                "id": i,
+                "word": word_segment.word,
+                "start": _quantize_time(word_segment.start_time),
+                "end": _quantize_time(word_segment.end_time),
+                "duration": _quantize_duration(word_segment.start_time, word_segment.end_time),
+                "confidence": round(word_segment.confidence, 3),
+                "segment_id": word_segment.segment_id
+            }
+            words.append(word_entry)
         
-        return json.dumps(subtitle_data, indent=2, ensure_ascii=False)
+        return {"words": words}
     
-    def export_for_editing(self, alignment_data: AlignmentData) -> str:
+    def _build_both_payload(self, alignment_data: AlignmentData) -> Dict[str, Any]:
+        """
+        Build both the segment and word entries of the subtitle JSON format.
+        
+        Args:
+            alignment_data: The alignment data
+            
+        Returns:
+            Dictionary containing the "subtitles" and "words" lists
+        """
+        payload = self._build_segments_payload(alignment_data)
+        payload.update(self._build_words_payload(alignment_data))
+        return payload
+    
+    # Builders for export_subtitle_format, keyed by format_type
+    _SUBTITLE_FORMAT_BUILDERS = {
+        "segments": _build_segments_payload,
+        "words": _build_words_payload,
+        "both": _build_both_payload
+    }
+    
+    def export_for_editing(self, alignment_data: AlignmentData, indent: bool = True) -> str:
         """
         Export alignment data in a format optimized for manual editing.
         
         Args:
             alignment_data: The alignment data to export
+            indent: Whether to pretty-print the JSON (indented by default for editing)
             
         Returns:
             JSON formatted data optimized for editing as string
@@ -189,7 +402,7 @@ class JSONExporter:
         editing_data = {
             "project": {
                 "name": f"Subtitle Project - {alignment_data.source_file}",
-                "created": datetime.now().isoformat(),
+                "created": _fast_iso_now(),
                 "audio_file": alignment_data.source_file,
                 "duration": alignment_data.audio_duration
             },
@@ -205,30 +418,45 @@ class JSONExporter:
         # Group words by segments for easier editing
         segments_with_words = self._group_words_by_segments(alignment_data)
         
-        for segment_id, (segment, words) in segments_with_words.items():
-            segment_entry = {
-                "id": segment_id,
-                "start_time": round(segment.start_time, 3),
-                "end_time": round(segment.end_time, 3),
-                "text": segment.text,
-                "confidence": round(segment.confidence, 3),
-                "editable": True,
-                "words": []
-            }
+        editing_data["segments"] = [
+            self._editing_segment_to_dict(segment_id, segment, words, {"text": segment.text})
+            for segment_id, (segment, words) in segments_with_words.items()
+        ]
+        
+        return self._dumps(editing_data, indent)
+    
+    def _editing_segment_to_dict(self, segment_id: int, segment: Segment, words: List[WordSegment],
+                                 text_fields: Dict[str, str]) -> Dict[str, Any]:
+        """
+        Convert a segment and its words to an editable entry for the editing exports.
+        
+        Args:
+            segment_id: ID of the segment
+            segment: The segment to convert
+            words: Word segments belonging to the segment, sorted by start time
+            text_fields: Text entries of the segment ("text", or the bilingual pair)
             
-            for word in words:
-                word_entry = {
+        Returns:
+            Dictionary representation of the editable segment
+        """
+        return {
+            "id": segment_id,
+            "start_time": _quantize_time(segment.start_time),
+            "end_time": _quantize_time(segment.end_time),
+            **text_fields,
+            "confidence": round(segment.confidence, 3),
+            "editable": True,
+            "words": [
+                {
                     "word": word.word,
-                    "start_time": round(word.start_time, 3),
-                    "end_time": round(word.end_time, 3),
+                    "start_time": _quantize_time(word.start_time),
+                    "end_time": _quantize_time(word.end_time),
                     "confidence": round(word.confidence, 3),
                     "editable": True
                 }
-                segment_entry["words"].append(word_entry)
-            
-            editing_data["segments"].append(segment_entry)
-        
-        return json.dumps(editing_data, indent=2, ensure_ascii=False)
+                for word in words
+            ]
+        }
     
     def _segment_to_dict(self, segment: Segment) -> Dict[str, Any]:
         """
@@ -241,9 +469,9 @@ class JSONExporter:
             Dictionary representation of the segment
         """
         return {
-            "start_time": round(segment.start_time, 3),
-            "end_time": round(segment.end_time, 3),
-            "duration": round(segment.end_time - segment.start_time, 3),
+            "start_time": _quantize_time(segment.start_time),
+            "end_time": _quantize_time(segment.end_time),
+            "duration": _quantize_duration(segment.start_time, segment.end_time),
             "text": segment.text,
             "confidence": round(segment.confidence, 3),
             "segment_id": segment.segment_id
@@ -261,9 +489,9 @@ class JSONExporter:
         """
         return {
             "word": word_segment.word,
-            "start_time": round(word_segment.start_time, 3),
-            "end_time": round(word_segment.end_time, 3),
-            "duration": round(word_segment.end_time - word_segment.start_time, 3),
+            "start_time": _quantize_time(word_segment.start_time),
+            "end_time": _quantize_time(word_segment.end_time),
+            "duration": _quantize_duration(word_segment.start_time, word_segment.end_time),
             "confidence": round(word_segment.confidence, 3),
             "segment_id": word_segment.segment_id
         }
@@ -279,7 +507,7 @@ class JSONExporter:
             Dictionary containing metadata
         """
         return {
-            "export_timestamp": datetime.now().isoformat(),
+            "export_timestamp": _fast_iso_now(),
             "format_version": "1.0",
             "exporter": "lyric-to-subtitle-app",
             "total_segments": len(alignment_data.segments),
@@ -302,30 +530,32 @@ class JSONExporter:
         if not alignment_data.segments or not alignment_data.word_segments:
             return {}
         
-        # Segment statistics
-        segment_durations = [seg.end_time - seg.start_time for seg in alignment_data.segments]
+        # Segment statistics (durations in integer milliseconds)
+        segment_durations = [_to_milliseconds(seg.end_time) - _to_milliseconds(seg.start_time)
+                             for seg in alignment_data.segments]
         segment_confidences = [seg.confidence for seg in alignment_data.segments]
         
-        # Word statistics
-        word_durations = [word.end_time - word.start_time for word in alignment_data.word_segments]
+        # Word statistics (durations in integer milliseconds)
+        word_durations = [_to_milliseconds(word.end_time) - _to_milliseconds(word.start_time)
+                          for word in alignment_data.word_segments]
         word_confidences = [word.confidence for word in alignment_data.word_segments]
         
         # Calculate statistics
         stats = {
             "segments": {
                 "count": len(alignment_data.segments),
-                "average_duration": round(sum(segment_durations) / len(segment_durations), 3),
-                "min_duration": round(min(segment_durations), 3),
-                "max_duration": round(max(segment_durations), 3),
+                "average_duration": round(sum(segment_durations) / len(segment_durations) / 1000, 3),
+                "min_duration": min(segment_durations) / 1000,
+                "max_duration": max(segment_durations) / 1000,
                 "average_confidence": round(sum(segment_confidences) / len(segment_confidences), 3),
                 "min_confidence": round(min(segment_confidences), 3),
                 "max_confidence": round(max(segment_confidences), 3)
             },
             "words": {
                 "count": len(alignment_data.word_segments),
-                "average_duration": round(sum(word_durations) / len(word_durations), 3),
-                "min_duration": round(min(word_durations), 3),
-                "max_duration": round(max(word_durations), 3),
+                "average_duration": round(sum(word_durations) / len(word_durations) / 1000, 3),
+                "min_duration": min(word_durations) / 1000,
+                "max_duration": max(word_durations) / 1000,
                 "average_confidence": round(sum(word_confidences) / len(word_confidences), 3),
                 "min_confidence": round(min(word_confidences), 3),
                 "max_confidence": round(max(word_confidences), 3)
@@ -420,8 +650,7 @@ class JSONExporter:
                             errors.append(f"Segment {i}: missing text field (must have 'text', 'bilingual_text', or both 'original_text' and 'translated_text')")
                         
                         # Check timing fields
-                        required_timing_fields = ["start_time", "end_time"]
-                        for field in required_timing_fields:
+                        for field in self._SEGMENT_TIMING_FIELDS:
                             if field not in segment:
                                 errors.append(f"Segment {i}: missing required field '{field}'")
                 
@@ -432,8 +661,7 @@ class JSONExporter:
                             errors.append(f"Word segment {i}: must be an object")
                             continue
                         
-                        required_fields = ["word", "start_time", "end_time"]
-                        for field in required_fields:
+                        for field in self._WORD_SEGMENT_REQUIRED_FIELDS:
                             if field not in word_segment:
                                 errors.append(f"Word segment {i}: missing required field '{field}'")
         else:
@@ -444,7 +672,8 @@ class JSONExporter:
     def export_bilingual_alignment_data(self, alignment_data: AlignmentData, 
                                       target_language: str,
                                       include_metadata: bool = True,
-                                      include_statistics: bool = True) -> str:
+                                      include_statistics: bool = True,
+                                      indent: bool = False) -> str:
         """
         Export bilingual alignment data to JSON format.
         Expects alignment data where segments contain bilingual text (original + translation).
@@ -454,6 +683,7 @@ class JSONExporter:
             target_language: The target language for translation
             include_metadata: Whether to include metadata information
             include_statistics: Whether to include statistical analysis
+            indent: Whether to pretty-print the JSON (compact by default)
             
         Returns:
             JSON formatted bilingual alignment data as string
@@ -481,7 +711,7 @@ class JSONExporter:
         json_data["word_segments"] = [self._word_segment_to_dict(word_segment) for word_segment in alignment_data.word_segments]
         
         # Add confidence scores
-        json_data["confidence_scores"] = alignment_data.confidence_scores
+        json_data["confidence_scores"] = list(alignment_data.confidence_scores)
         
         # Add audio information
         json_data["audio"] = {
@@ -499,11 +729,12 @@ class JSONExporter:
         if include_statistics:
             json_data["statistics"] = self._generate_statistics(alignment_data)
         
-        return json.dumps(json_data, indent=2, ensure_ascii=False)
+        return self._dumps(json_data, indent)
     
     def export_bilingual_subtitle_format(self, alignment_data: AlignmentData, 
                                        target_language: str,
-                                       format_type: str = "segments") -> str:
+                                       format_type: str = "segments",
+                                       indent: bool = False) -> str:
         """
         Export bilingual alignment data in a subtitle-friendly JSON format.
         
@@ -511,6 +742,7 @@ class JSONExporter:
             alignment_data: The bilingual alignment data to export
             target_language: The target language for translation
             format_type: Type of export ("segments", "words", or "both")
+            indent: Whether to pretty-print the JSON (compact by default)
             
         Returns:
             JSON formatted bilingual subtitle data as string
@@ -543,9 +775,9 @@ class JSONExporter:
                 
                 subtitle_entry = {
                     "id": i,
-                    "start": round(segment.start_time, 3),
-                    "end": round(segment.end_time, 3),
-                    "duration": round(segment.end_time - segment.start_time, 3),
+                    "start": _quantize_time(segment.start_time),
+                    "end": _quantize_time(segment.end_time),
+                    "duration": _quantize_duration(segment.start_time, segment.end_time),
                     "original_text": original_text,
                     "translated_text": translated_text,
                     "confidence": round(segment.confidence, 3)
@@ -553,28 +785,19 @@ class JSONExporter:
                 subtitle_data["subtitles"].append(subtitle_entry)
         
         if format_type in ["words", "both"]:
-            subtitle_data["words"] = []
-            for i, word_segment in enumerate(alignment_data.word_segments, 1):
-                word_entry = {
-                    "id": i,
-                    "word": word_segment.word,
-                    "start": round(word_segment.start_time, 3),
-                    "end": round(word_segment.end_time, 3),
-                    "duration": round(word_segment.end_time - word_segment.start_time, 3),
-                    "confidence": round(word_segment.confidence, 3),
-                    "segment_id": word_segment.segment_id
-                }
-                subtitle_data["words"].append(word_entry)
+            subtitle_data.update(self._build_words_payload(alignment_data))
         
-        return json.dumps(subtitle_data, indent=2, ensure_ascii=False)
+        return self._dumps(subtitle_data, indent)
     
-    def export_bilingual_for_editing(self, alignment_data: AlignmentData, target_language: str) -> str:
+    def export_bilingual_for_editing(self, alignment_data: AlignmentData, target_language: str,
+                                     indent: bool = True) -> str:
         """
         Export bilingual alignment data in a format optimized for manual editing.
         
         Args:
             alignment_data: The bilingual alignment data to export
             target_language: The target language for translation
+            indent: Whether to pretty-print the JSON (indented by default for editing)
             
         Returns:
             JSON formatted bilingual data optimized for editing as string
@@ -588,7 +811,7 @@ class JSONExporter:
         editing_data = {
             "project": {
                 "name": f"Bilingual Subtitle Project - {alignment_data.source_file}",
-                "created": datetime.now().isoformat(),
+                "created": _fast_iso_now(),
                 "audio_file": alignment_data.source_file,
                 "duration": alignment_data.audio_duration,
                 "target_language": target_language,
@@ -613,30 +836,12 @@ class JSONExporter:
             original_text = text_lines[0] if len(text_lines) > 0 else segment.text
             translated_text = text_lines[1] if len(text_lines) > 1 else ""
             
-            segment_entry = {
-                "id": segment_id,
-                "start_time": round(segment.start_time, 3),
-                "end_time": round(segment.end_time, 3),
-                "original_text": original_text,
-                "translated_text": translated_text,
-                "confidence": round(segment.confidence, 3),
-                "editable": True,
-                "words": []
-            }
-            
-            for word in words:
-                word_entry = {
-                    "word": word.word,
-                    "start_time": round(word.start_time, 3),
-                    "end_time": round(word.end_time, 3),
-                    "confidence": round(word.confidence, 3),
-                    "editable": True
-                }
-                segment_entry["words"].append(word_entry)
-            
-            editing_data["segments"].append(segment_entry)
+            editing_data["segments"].append(self._editing_segment_to_dict(
+                segment_id, segment, words,
+                {"original_text": original_text, "translated_text": translated_text}
+            ))
         
-        return json.dumps(editing_data, indent=2, ensure_ascii=False)
+        return self._dumps(editing_data, indent)
     
     def _bilingual_segment_to_dict(self, segment: Segment) -> Dict[str, Any]:
         """
@@ -654,9 +859,9 @@ class JSONExporter:
         translated_text = text_lines[1] if len(text_lines) > 1 else ""
         
         return {
-            "start_time": round(segment.start_time, 3),
-            "end_time": round(segment.end_time, 3),
-            "duration": round(segment.end_time - segment.start_time, 3),
+            "start_time": _quantize_time(segment.start_time),
+            "end_time": _quantize_time(segment.end_time),
+            "duration": _quantize_duration(segment.start_time, segment.end_time),
             "original_text": original_text,
             "translated_text": translated_text,
             "bilingual_text": segment.text,
@@ -677,6 +882,16 @@ class JSONExporter:
         Raises:
             ValueError: If JSON content is invalid or cannot be parsed
         """
+        # Fast path: typed decode straight into structs; anything it rejects goes
+        # through the validating path below for a descriptive error
+        if self._decoder is not None:
+            try:
+                envelope = self._decoder.decode(json_content)
+            except (msgspec.DecodeError, msgspec.ValidationError):
+                pass
+            else:
+                return self._envelope_to_alignment_data(envelope)
+        
         validation_errors = self.validate_json_content(json_content)
         if validation_errors:
             raise ValueError(f"Invalid JSON content: {'; '.join(validation_errors)}")
@@ -723,4 +938,44 @@ class JSONExporter:
             confidence_scores=confidence_scores,
             audio_duration=audio_duration,
             source_file=source_file
-        )
\ No newline at end of file
+        )
+    
+    def _envelope_to_alignment_data(self, envelope: "_AlignmentEnvelope") -> AlignmentData:
+        """
+        Convert a decoded msgspec alignment envelope to an AlignmentData object.
+        
+        Args:
+            envelope: The decoded alignment document
+            
+        Returns:
+            AlignmentData object built from the envelope
+        """
+        segments = [
+            Segment(
+                start_time=row.start_time,
+                end_time=row.end_time,
+                text=row.text,
+                confidence=row.confidence,
+                segment_id=row.segment_id
+            )
+            for row in envelope.segments
+        ]
+        
+        word_segments = [
+            WordSegment(
+                word=row.word,
+                start_time=row.start_time,
+                end_time=row.end_time,
+                confidence=row.confidence,
+                segment_id=row.segment_id
+            )
+            for row in envelope.word_segments
+        ]
+        
+        return AlignmentData(
+            segments=segments,
+            word_segments=word_segments,
+            confidence_scores=envelope.confidence_scores,
+            audio_duration=envelope.audio.duration,
+            source_file=envelope.audio.source_file
+        )
@@ -46,9 +46,15 @@ class DownloadResult:
 class ModelDownloader:
     """Handles downloading AI models with progress tracking and resumption."""
     
-    def __init__(self):
+    def __init__(self, models_dir: Optional[Path] = None):
+        """
+        Initialize the model downloader.
+        
+        Args:
+            models_dir: Directory to download models into; defaults to the configured models directory
+        """
         self.config = config_manager.get_config()
-        self.models_dir = Path(self.config.models_directory)
+        self.models_dir = Path(models_dir if models_dir is not None else self.config.models_directory)
         self.models_dir.mkdir(parents=True, exist_ok=True)
         
         # Progress callback
@@ -5,10 +5,12 @@ This module handles model availability checking, path resolution, and integrity
 """
 
 import os
+import mmap
 import hashlib
 import logging
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple, Set
+from types import MappingProxyType
+from typing import Dict, List, Optional, Tuple, Set, FrozenSet, Mapping, Any, BinaryIO
 import json
 
 from .interfaces import IModelManager, ModelType
@@ -18,78 +20,80 @@ from ..utils.config import config_manager
 logger = logging.getLogger(__name__)
 
 
+# Model metadata including checksums and URLs, keyed by (model type, model size).
+# This would typically be loaded from a configuration file; it is built once at
+# import and shared read-only by every ModelManager.
+_MODEL_METADATA: Mapping[Tuple[ModelType, ModelSize], Mapping[str, Any]] = MappingProxyType({
+    (ModelType.DEMUCS, ModelSize.BASE): MappingProxyType({
+        "filename": "htdemucs.th",
+        "checksum": "",  # Would be populated with actual checksums in production
+        "url": "https://dl.fbaipublicfiles.com/demucs/hybrid_transformer/htdemucs.th",
+        "size_mb": 319,  # Approximate size in MB
+        "description": "Hybrid Transformer Demucs model for vocal separation"
+    }),
+    (ModelType.WHISPERX, ModelSize.TINY): MappingProxyType({
+        "filename": "tiny.pt",
+        "checksum": "",
+        "url": "https://openaipublic.azureedge.net/main/whisper/models/tiny.pt",
+        "size_mb": 39,
+        "description": "Tiny WhisperX model - fastest, lowest accuracy"
+    }),
+    (ModelType.WHISPERX, ModelSize.BASE): MappingProxyType({
+        "filename": "base.pt",
+        "checksum": "",
+        "url": "https://openaipublic.azureedge.net/main/whisper/models/base.pt",
+        "size_mb": 74,
+        "description": "Base WhisperX model - balanced speed and accuracy"
+    }),
+    (ModelType.WHISPERX, ModelSize.SMALL): MappingProxyType({
+        "filename": "small.pt",
+        "checksum": "",
+        "url": "https://openaipublic.azureedge.net/main/whisper/models/small.pt",
+        "size_mb": 244,
+        "description": "Small WhisperX model - good accuracy"
+    }),
+    (ModelType.WHISPERX, ModelSize.MEDIUM): MappingProxyType({
+        "filename": "medium.pt",
+        "checksum": "",
+        "url": "https://openaipublic.azureedge.net/main/whisper/models/medium.pt",
+        "size_mb": 769,
+        "description": "Medium WhisperX model - high accuracy"
+    }),
+    (ModelType.WHISPERX, ModelSize.LARGE): MappingProxyType({
+        "filename": "large.pt",
+        "checksum": "",
+        "url": "https://openaipublic.azureedge.net/main/whisper/models/large.pt",
+        "size_mb": 1550,
+        "description": "Large WhisperX model - highest accuracy, slowest"
+    }),
+})
+
+_EMPTY_METADATA: Mapping[str, Any] = MappingProxyType({})
+
+
 class ModelManager(IModelManager):
     """Manages AI model availability, paths, and integrity verification."""
     
-    def __init__(self):
+    def __init__(self, models_dir: Optional[Path] = None):
+        """
+        Initialize the model manager.
+        
+        Args:
+            models_dir: Directory holding the models; defaults to the configured models directory
+        """
         self.config = config_manager.get_config()
-        self.models_dir = Path(self.config.models_directory)
+        self.models_dir = Path(models_dir if models_dir is not None else self.config.models_directory)
         self.models_dir.mkdir(parents=True, exist_ok=True)
         
-        # Model metadata for integrity checking
-        self._model_metadata = self._load_model_metadata()
-        
         # Progress callback for downloads
         self._download_progress_callback = None
         
         # Cache for model availability to avoid repeated file system checks
         self._availability_cache = {}
+        self._package_availability: Dict[ModelType, bool] = {}
         
         logger.info(f"ModelManager initialized with models directory: {self.models_dir}")
     
-    def _load_model_metadata(self) -> Dict[str, Dict[str, Dict[str, str]]]:
-        """Load model metadata including checksums and URLs."""
-        # This would typically be loaded from a configuration file
-        # For now, we'll define the expected model structure with realistic metadata
-        return {
-            ModelType.DEMUCS.value: {
-                ModelSize.BASE.value: {
-                    "filename": "htdemucs.th",
-                    "checksum": "",  # Would be populated with actual checksums in production
-                    "url": "https://dl.fbaipublicfiles.com/demucs/hybrid_transformer/htdemucs.th",
-                    "size_mb": 319,  # Approximate size in MB
-                    "description": "Hybrid Transformer Demucs model for vocal separation"
-                }
-            },
-            ModelType.WHISPERX.value: {
-                ModelSize.TINY.value: {
-                    "filename": "tiny.pt",
-                    "checksum": "",
-                    "url": "https://openaipublic.azureedge.net/main/whisper/models/tiny.pt",
-                    "size_mb": 39,
-                    "description": "Tiny WhisperX model - fastest, lowest accuracy"
-                },
-                ModelSize.BASE.value: {
-                    "filename": "base.pt", 
-                    "checksum": "",
-                    "url": "https://openaipublic.azureedge.net/main/whisper/models/base.pt",
-                    "size_mb": 74,
-                    "description": "Base WhisperX model - balanced speed and accuracy"
-                },
-                ModelSize.SMALL.value: {
-                    "filename": "small.pt",
-                    "checksum": "",
-                    "url": "https://openaipublic.azureedge.net/main/whisper/models/small.pt",
-                    "size_mb": 244,
-                    "description": "Small WhisperX model - good accuracy"
-                },
-                ModelSize.MEDIUM.value: {
-                    "filename": "medium.pt",
-                    "checksum": "",
-                    "url": "https://openaipublic.azureedge.net/main/whisper/models/medium.pt",
-                    "size_mb": 769,
-                    "description": "Medium WhisperX model - high accuracy"
-                },
-                ModelSize.LARGE.value: {
-                    "filename": "large.pt",
-                    "checksum": "",
-                    "url": "https://openaipublic.azureedge.net/main/whisper/models/large.pt",
-                    "size_mb": 1550,
-                    "description": "Large WhisperX model - highest accuracy, slowest"
-                }
-            }
-        } 
-   
     def check_model_availability(self, model_type: ModelType, model_size: ModelSize) -> bool:
         """Check if a specific model is available locally."""
         cache_key = f"{model_type.value}_{model_size.value}"
@@ -98,6 +102,26 @@ class ModelManager(IModelManager):
         if cache_key in self._availability_cache:
             return self._availability_cache[cache_key]
         
+        is_available = self._check_package_availability(model_type)
+        self._availability_cache[cache_key] = is_available
+        return is_available
+    
+    def _check_package_availability(self, model_type: ModelType) -> bool:
+        """
+        Check whether the package backing a model type can be imported.
+        
+        Availability depends only on the model type, so the probe result is
+        cached per type and shared by every model size.
+        
+        Args:
+            model_type: Type of model to probe
+            
+        Returns:
+            True if the backing package is installed
+        """
+        if model_type in self._package_availability:
+            return self._package_availability[model_type]
+        
         try:
             # For the new implementation, we check if the packages are installed
             # rather than looking for specific model files
@@ -108,54 +132,53 @@ class ModelManager(IModelManager):
                 try:
                     from audio_separator.separator import Separator
                     is_available = True
-                    logger.debug(f"audio-separator package available for {model_type.value}/{model_size.value}")
+                    logger.debug(f"audio-separator package available for {model_type.value}")
                 except ImportError:
                     is_available = False
-                    logger.debug(f"audio-separator package not available for {model_type.value}/{model_size.value}")
+                    logger.debug(f"audio-separator package not available for {model_type.value}")
             
             elif model_type == ModelType.WHISPERX:
                 # Check if whisper is available
                 try:
                     import whisper
                     is_available = True
-                    logger.debug(f"whisper package available for {model_type.value}/{model_size.value}")
+                    logger.debug(f"whisper package available for {model_type.value}")
                 except ImportError:
                     is_available = False
-                    logger.debug(f"whisper package not available for {model_type.value}/{model_size.value}")
-            
-            # Cache the result
-            self._availability_cache[cache_key] = is_available
-            return is_available
+                    logger.debug(f"whisper package not available for {model_type.value}")
             
         except Exception as e:
-            logger.error(f"Error checking model availability for {model_type.value} {model_size.value}: {e}")
-            self._availability_cache[cache_key] = False
-            return False
+            logger.error(f"Error checking model availability for {model_type.value}: {e}")
+            is_available = False
+        
+        self._package_availability[model_type] = is_available
+        return is_available
     
     def get_model_path(self, model_type: ModelType, model_size: ModelSize) -> str:
         """Get the local path to a model."""
         model_path = self._get_model_file_path(model_type, model_size)
         
-        if not model_path.exists():
+        # A single stat both checks existence and feeds the integrity check
+        try:
+            file_stat = os.stat(model_path)
+        except FileNotFoundError:
             raise FileNotFoundError(f"Model {model_type.value}/{model_size.value} not found at {model_path}")
         
-        if not self._verify_model_integrity(model_type, model_size, model_path):
+        if not self._verify_model_integrity(model_type, model_size, model_path, file_stat):
             raise ValueError(f"Model {model_type.value}/{model_size.value} failed integrity check")
         
         return str(model_path)
     
-    def list_available_models(self) -> Dict[ModelType, List[ModelSize]]:
+    def list_available_models(self) -> Dict[ModelType, FrozenSet[ModelSize]]:
         """List all locally available models."""
         available_models = {}
         
         for model_type in ModelType:
-            available_sizes = []
-            for model_size in ModelSize:
-                if self.check_model_availability(model_type, model_size):
-                    available_sizes.append(model_size)
+            # One probe per type covers every size of that type
+            if not self._check_package_availability(model_type):
+                continue
             
-            if available_sizes:
-                available_models[model_type] = available_sizes
+            available_models[model_type] = frozenset(ModelSize)
         
         return available_models
     
@@ -172,9 +195,8 @@ class ModelManager(IModelManager):
         logger.info("Checking required models for application startup")
         results = {}
         
-        for model_type, model_size in required_models.items():
+        for (model_type, model_size), is_available in self._scan_required(required_models).items():
             model_key = f"{model_type.value}_{model_size.value}"
-            is_available = self.check_model_availability(model_type, model_size)
             results[model_key] = is_available
             
             if is_available:
@@ -194,13 +216,29 @@ class ModelManager(IModelManager):
         Returns:
             List of tuples containing missing model type and size
         """
-        missing_models = []
+        return [
+            model for model, is_available in self._scan_required(required_models).items()
+            if not is_available
+        ]
+    
+    def _scan_required(self, required_models: Dict[ModelType, ModelSize]) -> Dict[Tuple[ModelType, ModelSize], bool]:
+        """
+        Resolve availability for every required model in one pass.
         
-        for model_type, model_size in required_models.items():
-            if not self.check_model_availability(model_type, model_size):
-                missing_models.append((model_type, model_size))
+        Results come from the availability cache, so back-to-back calls to
+        check_required_models, get_missing_models and is_offline_ready with
+        the same requirements do not re-probe anything.
         
-        return missing_models
+        Args:
+            required_models: Dictionary mapping model types to required sizes
+            
+        Returns:
+            Dictionary mapping (model type, model size) to availability
+        """
+        return {
+            (model_type, model_size): self.check_model_availability(model_type, model_size)
+            for model_type, model_size in required_models.items()
+        }
     
     def is_offline_ready(self, required_models: Dict[ModelType, ModelSize]) -> bool:
         """
@@ -226,7 +264,7 @@ class ModelManager(IModelManager):
         """Download a model if not available locally."""
         from .model_downloader import ModelDownloader
         
-        downloader = ModelDownloader()
+        downloader = ModelDownloader(models_dir=self.models_dir)
         if self._download_progress_callback:
             # Wrap the progress callback to match ModelDownloader's expected signature
             def progress_wrapper(progress):
@@ -239,6 +277,7 @@ class ModelManager(IModelManager):
         cache_key = f"{model_type.value}_{model_size.value}"
         if cache_key in self._availability_cache:
             del self._availability_cache[cache_key]
+        self._package_availability.pop(model_type, None)
         
         return result.success
     
@@ -247,25 +286,42 @@ class ModelManager(IModelManager):
         self._download_progress_callback = callback   
  
     def _get_model_file_path(self, model_type: ModelType, model_size: ModelSize) -> Path:
-        """Get the expected file path for a model."""
+        """Get the expected file path for a model (the directory is created on download)."""
         model_dir = self.models_dir / model_type.value
-        model_dir.mkdir(parents=True, exist_ok=True)
         
         # Get filename from metadata
-        metadata = self._model_metadata.get(model_type.value, {}).get(model_size.value, {})
+        metadata = self.get_model_metadata(model_type, model_size)
         filename = metadata.get("filename", f"{model_size.value}.pt")
         
         return model_dir / filename
     
-    def _verify_model_integrity(self, model_type: ModelType, model_size: ModelSize, model_path: Path) -> bool:
-        """Verify model file integrity using checksums."""
-        if not model_path.exists():
-            logger.debug(f"Model file does not exist: {model_path}")
-            return False
+    def _verify_model_integrity(self, model_type: ModelType, model_size: ModelSize, model_path: Path,
+                                file_stat: Optional[os.stat_result] = None) -> bool:
+        """
+        Verify model file integrity using checksums.
+        
+        Args:
+            model_type: Type of model
+            model_size: Size of model
+            model_path: Path to the model file
+            file_stat: Result of a stat() call the caller already made on model_path
+            
+        Returns:
+            True if the model file passes the integrity checks, False otherwise
+        """
+        if file_stat is None:
+            try:
+                file_stat = os.stat(model_path)
+            except FileNotFoundError:
+                logger.debug(f"Model file does not exist: {model_path}")
+                return False
+            except OSError as e:
+                logger.error(f"Error checking model file size: {e}")
+                return False
         
         # Check if file is empty or too small
         try:
-            file_size = model_path.stat().st_size
+            file_size = file_stat.st_size
             if file_size == 0:
                 logger.warning(f"Model file is empty: {model_path}")
                 return False
@@ -289,7 +345,7 @@ class ModelManager(IModelManager):
             return False
         
         # Get expected checksum from metadata
-        metadata = self._model_metadata.get(model_type.value, {}).get(model_size.value, {})
+        metadata = self.get_model_metadata(model_type, model_size)
         expected_checksum = metadata.get("checksum", "")
         
         # If no checksum is available, assume file is valid (for development)
@@ -299,7 +355,7 @@ class ModelManager(IModelManager):
         
         # Calculate actual checksum
         logger.debug(f"Verifying checksum for {model_type.value}/{model_size.value}")
-        actual_checksum = self._calculate_file_checksum(model_path)
+        actual_checksum = self._get_cached_checksum(model_path, file_stat)
         
         if actual_checksum == expected_checksum:
             logger.debug(f"Checksum verification passed for {model_type.value}/{model_size.value}")
@@ -309,22 +365,97 @@ class ModelManager(IModelManager):
             logger.error(f"Expected: {expected_checksum}, Got: {actual_checksum}")
             return False
     
+    def _get_cached_checksum(self, model_path: Path, file_stat: os.stat_result) -> str:
+        """
+        Get the SHA256 checksum of a model file, skipping the hash when it is unchanged.
+        
+        The digest is stored in a "<model>.sha256.json" sidecar together with the file
+        size and modification time, and reused while both still match.
+        
+        Args:
+            model_path: Path to the model file
+            file_stat: Current stat() result for model_path
+            
+        Returns:
+            Hex SHA256 digest, or an empty string if the file could not be read
+        """
+        sidecar_path = model_path.with_name(model_path.name + ".sha256.json")
+        
+        try:
+            with open(sidecar_path, "r", encoding="utf-8") as f:
+                cached = json.load(f)
+            if (cached.get("size") == file_stat.st_size and
+                    cached.get("mtime_ns") == file_stat.st_mtime_ns and
+                    cached.get("sha256")):
+                return cached["sha256"]
+        except (OSError, ValueError, AttributeError):
+            pass
+        
+        checksum = self._calculate_file_checksum(model_path)
+        
+        if checksum:
+            # Write to a temporary file and rename so readers never see a partial sidecar
+            temp_path = sidecar_path.with_name(sidecar_path.name + ".tmp")
+            try:
+                with open(temp_path, "w", encoding="utf-8") as f:
+                    json.dump({
+                        "size": file_stat.st_size,
+                        "mtime_ns": file_stat.st_mtime_ns,
+                        "sha256": checksum
+                    }, f)
+                os.replace(temp_path, sidecar_path)
+            except OSError as e:
+                logger.debug(f"Could not write checksum cache {sidecar_path}: {e}")
+            finally:
+                # Drop a partial temporary file left behind by a failed write
+                try:
+                    temp_path.unlink(missing_ok=True)
+                except OSError:
+                    pass
+        
+        return checksum
+    
     def _calculate_file_checksum(self, file_path: Path) -> str:
         """Calculate SHA256 checksum of a file."""
-        sha256_hash = hashlib.sha256()
-        
         try:
             with open(file_path, "rb") as f:
-                # Read file in chunks to handle large files
-                for chunk in iter(lambda: f.read(4096), b""):
-                    sha256_hash.update(chunk)
-            return sha256_hash.hexdigest()
+                # Before Python 3.11 hash a read-only memory map of the file rather than
+                # copying it through Python buffers (mmap rejects empty files)
+                if not hasattr(hashlib, "file_digest") and os.fstat(f.fileno()).st_size > 0:
+                    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                        return hashlib.sha256(mapped).hexdigest()
+                
+                return self._hash_stream(f)
         except Exception:
             return ""
     
-    def get_model_metadata(self, model_type: ModelType, model_size: ModelSize) -> Dict[str, str]:
-        """Get metadata for a specific model."""
-        return self._model_metadata.get(model_type.value, {}).get(model_size.value, {})
+    def _hash_stream(self, fileobj: BinaryIO) -> str:
+        """
+        Calculate SHA256 checksum of a binary file object from its current position.
+        
+        Args:
+            fileobj: Binary file object such as an open file or io.BytesIO
+            
+        Returns:
+            Hex-encoded SHA256 digest
+        """
+        # Python 3.11+ hashes the stream without copying it through Python buffers
+        if hasattr(hashlib, "file_digest"):
+            return hashlib.file_digest(fileobj, "sha256").hexdigest()
+        
+        sha256_hash = hashlib.sha256()
+        for chunk in iter(lambda: fileobj.read(1024 * 1024), b""):
+            sha256_hash.update(chunk)
+        return sha256_hash.hexdigest()
+    
+    def get_model_metadata(self, model_type: ModelType, model_size: ModelSize) -> Mapping[str, Any]:
+        """
+        Get metadata for a specific model.
+        
+        The returned mapping is shared and read-only; copy it with dict()
+        before modifying.
+        """
+        return _MODEL_METADATA.get((model_type, model_size), _EMPTY_METADATA)
     
     def get_models_directory(self) -> str:
         """Get the models directory path."""
@@ -334,13 +465,21 @@ class ModelManager(IModelManager):
         """Clear all cached models."""
         try:
             import shutil
-            if self.models_dir.exists():
-                logger.info("Clearing model cache directory")
-                shutil.rmtree(self.models_dir)
+            # Empty the directory in place rather than deleting and recreating the root
+            try:
+                with os.scandir(self.models_dir) as entries:
+                    logger.info("Clearing model cache directory")
+                    for entry in entries:
+                        if entry.is_dir(follow_symlinks=False):
+                            shutil.rmtree(entry.path)
+                        else:
+                            os.unlink(entry.path)
+            except FileNotFoundError:
                 self.models_dir.mkdir(parents=True, exist_ok=True)
             
             # Clear availability cache
             self._availability_cache.clear()
+            self._package_availability.clear()
             logger.info("Model cache cleared successfully")
             return True
         except Exception as e:
@@ -351,6 +490,7 @@ class ModelManager(IModelManager):
         """Invalidate the availability cache to force fresh checks."""
         logger.debug("Invalidating model availability cache")
         self._availability_cache.clear()
+        self._package_availability.clear()
     
     def get_model_info(self, model_type: ModelType, model_size: ModelSize) -> Dict[str, any]:
         """
@@ -372,17 +512,22 @@ class ModelManager(IModelManager):
             "size": model_size.value,
             "available": is_available,
             "path": str(model_path),
-            "metadata": metadata
+            "metadata": dict(metadata)
         }
         
-        if model_path.exists():
-            try:
-                file_stat = model_path.stat()
-                info["file_size_bytes"] = file_stat.st_size
-                info["file_size_mb"] = round(file_stat.st_size / (1024 * 1024), 2)
-                info["last_modified"] = file_stat.st_mtime
-            except OSError as e:
-                logger.warning(f"Could not get file stats for {model_path}: {e}")
+        # A single stat both checks existence and provides the file details
+        try:
+            file_stat = os.stat(model_path)
+        except FileNotFoundError:
+            file_stat = None
+        except OSError as e:
+            file_stat = None
+            logger.warning(f"Could not get file stats for {model_path}: {e}")
+        
+        if file_stat is not None:
+            info["file_size_bytes"] = file_stat.st_size
+            info["file_size_mb"] = round(file_stat.st_size / (1024 * 1024), 2)
+            info["last_modified"] = file_stat.st_mtime
         
         return info
     
@@ -393,9 +538,7 @@ class ModelManager(IModelManager):
         for model_type in ModelType:
             for model_size in ModelSize:
                 # Only include models that have metadata defined
-                if (model_type.value in self._model_metadata and 
-                    model_size.value in self._model_metadata[model_type.value]):
-                    
+                if (model_type, model_size) in _MODEL_METADATA:
                     key = f"{model_type.value}_{model_size.value}"
                     all_info[key] = self.get_model_info(model_type, model_size)
         
@@ -47,6 +47,12 @@ class SpeechRecognizer:
         self.device = self._determine_device(device)
         self.progress_callback: Optional[Callable[[float, str], None]] = None
         self._whisper_model = None
+        self._align_model = None
+        self._align_metadata = None
+        
+        # Confidence thresholds for flagging uncertain segments
+        self.low_confidence_threshold = 0.6
+        self.word_confidence_threshold = 0.5
     
     def _determine_device(self, device: str) -> str:
         """Determine the appropriate device for inference."""
@@ -155,17 +161,6 @@ class SpeechRecognizer:
         if self.progress_callback:
             self.progress_callback(percentage, message)
     
-    def set_progress_callback(self, callback: Callable[[float, str], None]) -> None:
-        """Set callback function for progress updates."""
-        self.progress_callback = callback
-        self._whisper_model = None
-        self._align_model = None
-        self._align_metadata = None
-        
-        # Confidence thresholds for flagging uncertain segments
-        self.low_confidence_threshold = 0.6
-        self.word_confidence_threshold = 0.5
-    
     def set_progress_callback(self, callback: Callable[[float, str], None]) -> None:
         """
         Set callback function for progress updates.
@@ -94,12 +94,13 @@ class SubtitleGenerator(ISubtitleGenerator):
         """
         return self.vtt_exporter.generate_sentence_level(alignment_data)
     
-    def export_json_alignment(self, alignment_data: AlignmentData) -> str:
+    def export_json_alignment(self, alignment_data: AlignmentData, indent: bool = False) -> str:
         """
         Export alignment data as JSON.
         
         Args:
             alignment_data: The alignment data to export
+            indent: Whether to pretty-print the JSON (compact by default)
             
         Returns:
             JSON formatted alignment data as string
@@ -107,7 +108,7 @@ class SubtitleGenerator(ISubtitleGenerator):
         Raises:
             ValueError: If alignment data is invalid
         """
-        return self.json_exporter.export_alignment_data(alignment_data)
+        return self.json_exporter.export_alignment_data(alignment_data, indent=indent)
     
     def save_subtitle_file(self, content: str, file_path: str, format_type: ExportFormat) -> bool:
         """
@@ -9,6 +9,7 @@ import os
 import tempfile
 import shutil
 import time
+from dataclasses import dataclass
 from pathlib import Path
 from typing import Optional, Callable, Dict, Any
 import logging
@@ -20,17 +21,14 @@ from ..services.interfaces import ProcessingError
 logger = logging.getLogger(__name__)
 
 
+@dataclass(frozen=True)
 class VocalSeparationResult:
     """Result of vocal separation operation."""
-    
-    def __init__(self, success: bool, vocals_path: Optional[str] = None, 
-                 instrumental_path: Optional[str] = None,
-                 error_message: Optional[str] = None, processing_time: float = 0.0):
-        self.success = success
-        self.vocals_path = vocals_path
-        self.instrumental_path = instrumental_path
-        self.error_message = error_message
-        self.processing_time = processing_time
+    success: bool
+    vocals_path: Optional[str] = None
+    instrumental_path: Optional[str] = None
+    error_message: Optional[str] = None
+    processing_time: float = 0.0
 
 
 class VocalSeparator:
@@ -269,7 +267,7 @@ class VocalSeparator:
             import torch
             import torchaudio
         except ImportError as e:
-            missing_package = str(e).split("'")[1] if "'" in str(e) else "unknown package"
+            missing_package = e.name or (str(e).split("'")[1] if "'" in str(e) else "unknown package")
             raise ProcessingError(
                 f"Required package '{missing_package}' is not installed. "
                 f"Please install it with: pip install demucs torch torchaudio"
@@ -6,10 +6,88 @@ supporting web-compatible subtitle generation with proper timing formatting and
 """
 
 import re
-from typing import List, Optional
+import math
+import functools
+from typing import List, Optional, Sequence
+import numpy as np
 from ..models.data_models import AlignmentData, Segment, WordSegment
 
 
+# VTT timestamp: HH:MM:SS.mmm or MM:SS.mmm, with the numeric fields captured
+_TIMESTAMP_RE = re.compile(r'^(?:(\d{2}):)?(\d{2}):(\d{2})\.(\d{3})$')
+# Runs of spaces/tabs collapsed to one space (newlines are kept)
+_WHITESPACE_RE = re.compile(r'[ \t]+')
+# Control characters other than newlines
+_CONTROL_CHARS_RE = re.compile(r'[\x00-\x08\x0B\x0C\x0E-\x1F\x7F]')
+
+
+@functools.lru_cache(maxsize=8192)
+def _format_vtt_timestamp(seconds: float) -> str:
+    """
+    Format a single timestamp in VTT format (HH:MM:SS.mmm), memoized by value.
+    
+    Used by the per-cue exports (grouped and styled word cues), where a cue's
+    start usually repeats the previous cue's end. Whole lists of cue times go
+    through _format_vtt_timestamps instead, which does not use this cache.
+    
+    Args:
+        seconds: Time in seconds
+        
+    Returns:
+        Formatted timestamp string
+        
+    Raises:
+        ValueError: If seconds is NaN or infinite
+    """
+    if not math.isfinite(seconds):
+        raise ValueError(f"Timestamp must be a finite number of seconds, got {seconds}")
+    
+    # Round to avoid floating point precision issues
+    seconds = round(seconds, 3)
+    
+    # Convert to hours, minutes, seconds, milliseconds
+    hours = int(seconds // 3600)
+    minutes = int((seconds % 3600) // 60)
+    secs = int(seconds % 60)
+    milliseconds = int(round((seconds % 1) * 1000))
+    
+    return f"{hours:02d}:{minutes:02d}:{secs:02d}.{milliseconds:03d}"
+
+
+def _format_vtt_timestamps(seconds: Sequence[float]) -> List[str]:
+    """
+    Format a batch of timestamps in VTT format (HH:MM:SS.mmm).
+    
+    The hour/minute/second/millisecond fields are split out in a single numpy
+    pass over integer milliseconds.
+    
+    Args:
+        seconds: Times in seconds
+        
+    Returns:
+        Formatted timestamp strings, in input order
+        
+    Raises:
+        ValueError: If any time is NaN or infinite
+    """
+    # Round exactly like the scalar path (Python's round is correctly rounded,
+    # numpy's scale-and-rint is not), then peel off each field with integer divmod
+    rounded = np.fromiter((round(value, 3) for value in seconds), dtype=np.float64, count=len(seconds))
+    if not np.isfinite(rounded).all():
+        bad_value = rounded[~np.isfinite(rounded)][0]
+        raise ValueError(f"Timestamp must be a finite number of seconds, got {bad_value}")
+    
+    milliseconds = np.rint(rounded * 1000).astype(np.int64)
+    hours, milliseconds = np.divmod(milliseconds, 3_600_000)
+    minutes, milliseconds = np.divmod(milliseconds, 60_000)
+    secs, milliseconds = np.divmod(milliseconds, 1000)
+    
+    return [
+        f"{h:02d}:{m:02d}:{s:02d}.{ms:03d}"
+        for h, m, s, ms in zip(hours.tolist(), minutes.tolist(), secs.tolist(), milliseconds.tolist())
+    ]
+
+
 class VTTExporter:
     """Handles export of alignment data to VTT (WebVTT) subtitle format."""
     
@@ -34,12 +112,13 @@ class VTTExporter:
             raise ValueError("Alignment data must contain at least one segment")
         
         vtt_content = ["WEBVTT", ""]  # VTT files must start with "WEBVTT"
+        segments = alignment_data.segments
         
-        for segment in alignment_data.segments:
-            # Format timing
-            start_time = self._format_timestamp(segment.start_time)
-            end_time = self._format_timestamp(segment.end_time)
-            
+        # Format timing for all segments in one batch
+        start_times = self._format_timestamps([segment.start_time for segment in segments])
+        end_times = self._format_timestamps([segment.end_time for segment in segments])
+        
+        for segment, start_time, end_time in zip(segments, start_times, end_times):
             # Escape and clean text
             text = self._escape_text(segment.text)
             
@@ -66,12 +145,13 @@ class VTTExporter:
             raise ValueError("Alignment data must contain at least one word segment")
         
         vtt_content = ["WEBVTT", ""]  # VTT files must start with "WEBVTT"
+        word_segments = alignment_data.word_segments
         
-        for word_segment in alignment_data.word_segments:
-            # Format timing
-            start_time = self._format_timestamp(word_segment.start_time)
-            end_time = self._format_timestamp(word_segment.end_time)
-            
+        # Format timing for all words in one batch
+        start_times = self._format_timestamps([word_segment.start_time for word_segment in word_segments])
+        end_times = self._format_timestamps([word_segment.end_time for word_segment in word_segments])
+        
+        for word_segment, start_time, end_time in zip(word_segments, start_times, end_times):
             # Escape and clean text
             text = self._escape_text(word_segment.word)
             
@@ -140,12 +220,13 @@ class VTTExporter:
             raise ValueError("Alignment data must contain at least one segment")
         
         vtt_content = ["WEBVTT", ""]
+        segments = alignment_data.segments
         
-        for i, segment in enumerate(alignment_data.segments, 1):
-            # Format timing
-            start_time = self._format_timestamp(segment.start_time)
-            end_time = self._format_timestamp(segment.end_time)
-            
+        # Format timing for all segments in one batch
+        start_times = self._format_timestamps([segment.start_time for segment in segments])
+        end_times = self._format_timestamps([segment.end_time for segment in segments])
+        
+        for i, (segment, start_time, end_time) in enumerate(zip(segments, start_times, end_times), 1):
             # Escape and clean text
             text = self._escape_text(segment.text)
             
@@ -170,16 +251,19 @@ class VTTExporter:
         Returns:
             Formatted timestamp string
         """
-        # Round to avoid floating point precision issues
-        seconds = round(seconds, 3)
-        
-        # Convert to hours, minutes, seconds, milliseconds
-        hours = int(seconds // 3600)
-        minutes = int((seconds % 3600) // 60)
-        secs = int(seconds % 60)
-        milliseconds = int(round((seconds % 1) * 1000))
+        return _format_vtt_timestamp(seconds)
+    
+    def _format_timestamps(self, seconds: Sequence[float]) -> List[str]:
+        """
+        Format a batch of timestamps in VTT format (HH:MM:SS.mmm).
         
-        return f"{hours:02d}:{minutes:02d}:{secs:02d}.{milliseconds:03d}"
+        Args:
+            seconds: Times in seconds
+            
+        Returns:
+            Formatted timestamp strings, in input order
+        """
+        return _format_vtt_timestamps(seconds)
     
     def _escape_text(self, text: str) -> str:
         """
@@ -198,10 +282,10 @@ class VTTExporter:
         text = text.strip()
         
         # Replace multiple whitespace with single space (but preserve newlines)
-        text = re.sub(r'[ \t]+', ' ', text)
+        text = _WHITESPACE_RE.sub(' ', text)
         
         # Remove control characters except newlines
-        text = re.sub(r'[\x00-\x08\x0B\x0C\x0E-\x1F\x7F]', '', text)
+        text = _CONTROL_CHARS_RE.sub('', text)
         
         # Handle common HTML entities that might appear
         text = text.replace('&amp;', '&')
@@ -317,31 +401,15 @@ class VTTExporter:
             True if valid, False otherwise
         """
         # VTT format: HH:MM:SS.mmm or MM:SS.mmm
-        pattern = r'^(\d{2}:)?\d{2}:\d{2}\.\d{3}$'
-        if not re.match(pattern, timestamp):
+        match = _TIMESTAMP_RE.match(timestamp)
+        if match is None:
             return False
         
-        # Additional validation for time ranges
-        parts = timestamp.split(':')
-        if len(parts) == 3:  # HH:MM:SS.mmm format
-            hours = int(parts[0])
-            minutes = int(parts[1])
-            seconds_parts = parts[2].split('.')
-            seconds = int(seconds_parts[0])
-            
-            # Validate ranges
-            if hours > 23 or minutes > 59 or seconds > 59:
-                return False
-        elif len(parts) == 2:  # MM:SS.mmm format
-            minutes = int(parts[0])
-            seconds_parts = parts[1].split('.')
-            seconds = int(seconds_parts[0])
-            
-            # Validate ranges
-            if minutes > 59 or seconds > 59:
-                return False
-        
-        return True
+        # Additional validation for time ranges (hours are absent in MM:SS.mmm format)
+        hours, minutes, seconds, _ = match.groups()
+        if hours is not None and int(hours) > 23:
+            return False
+        return int(minutes) <= 59 and int(seconds) <= 59
     
     def generate_bilingual_sentence_level(self, alignment_data: AlignmentData) -> str:
         """
@@ -494,12 +562,13 @@ class VTTExporter:
             raise ValueError("Alignment data must contain at least one segment")
         
         vtt_content = ["WEBVTT", ""]
+        segments = alignment_data.segments
         
-        for i, segment in enumerate(alignment_data.segments, 1):
-            # Format timing
-            start_time = self._format_timestamp(segment.start_time)
-            end_time = self._format_timestamp(segment.end_time)
-            
+        # Format timing for all segments in one batch
+        start_times = self._format_timestamps([segment.start_time for segment in segments])
+        end_times = self._format_timestamps([segment.end_time for segment in segments])
+        
+        for i, (segment, start_time, end_time) in enumerate(zip(segments, start_times, end_times), 1):
             # Handle bilingual text - split by newline if present
             text_lines = segment.text.split('\n')
             if len(text_lines) > 1:
@@ -552,12 +621,13 @@ class VTTExporter:
             }
         
         vtt_content = ["WEBVTT", ""]
+        segments = alignment_data.segments
         
-        for i, segment in enumerate(alignment_data.segments, 1):
-            # Format timing
-            start_time = self._format_timestamp(segment.start_time)
-            end_time = self._format_timestamp(segment.end_time)
-            
+        # Format timing for all segments in one batch
+        start_times = self._format_timestamps([segment.start_time for segment in segments])
+        end_times = self._format_timestamps([segment.end_time for segment in segments])
+        
+        for i, (segment, start_time, end_time) in enumerate(zip(segments, start_times, end_times), 1):
             # Determine style class based on confidence
             if segment.confidence >= 0.8:
                 css_class = style_classes.get('high', 'high-confidence')
@@ -568,7 +568,9 @@ class FirstRunWizard(QDialog):
         
         summary_text = "<ul>"
         for model_type, sizes in available_models.items():
-            for size in sizes:
+            for size in ModelSize:
+                if size not in sizes:
+                    continue
                 summary_text += f"<li>✅ {model_type.value} ({size.value}) - Ready</li>"
         summary_text += "</ul>"
         
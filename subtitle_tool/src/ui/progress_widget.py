@@ -6,7 +6,9 @@ indicators, estimated completion times, current operation status, and cancellati
 """
 
 import time
-from typing import Optional, Callable, Dict, Any
+from collections import deque
+from itertools import islice
+from typing import Optional, Callable, Dict, Any, List, Tuple
 from datetime import datetime, timedelta
 
 from PyQt6.QtCore import Qt, QTimer, pyqtSignal, QThread, pyqtSlot
@@ -18,6 +20,10 @@ from PyQt6.QtWidgets import (
 from PyQt6.QtGui import QFont, QPalette, QColor
 
 
+# Maximum number of progress updates kept for speed calculation
+MAX_PROGRESS_HISTORY = 1024
+
+
 class ProgressWidget(QWidget):
     """
     Comprehensive progress tracking widget with real-time indicators.
@@ -46,7 +52,7 @@ class ProgressWidget(QWidget):
         self._is_processing = False
         self._start_time: Optional[float] = None
         self._last_update_time: Optional[float] = None
-        self._progress_history: list = []
+        self._progress_history: deque = deque(maxlen=MAX_PROGRESS_HISTORY)
         self._estimated_total_time: Optional[float] = None
         
         # Cancellation support
@@ -363,20 +369,48 @@ class ProgressWidget(QWidget):
             'operation': self._current_operation
         })
         
-        # Keep only recent history (last 10 minutes)
-        cutoff_time = current_time - 600
-        self._progress_history = [
-            entry for entry in self._progress_history 
-            if entry['time'] > cutoff_time
-        ]
-        
         # Update UI
         self._update_progress_displays()
         self._log_progress(f"{self._overall_progress:.1f}% - {message}")
         
         # Emit signal
         self.progress_updated.emit(overall_percentage, message)
-        
+
+    def bulk_update_progress(self, entries: List[Tuple[float, float, str]]) -> None:
+        """
+        Record several progress updates at once.
+
+        The history is extended in a single pass and the displays and
+        progress_updated signal are refreshed once, for the last entry only.
+
+        Args:
+            entries: Sequence of (timestamp, overall_percentage, message) tuples
+        """
+        if not self._is_processing or not entries:
+            return
+
+        self._progress_history.extend(
+            {
+                'time': t,
+                'progress': max(0.0, min(100.0, p)),
+                'message': m,
+                'operation': self._current_operation
+            }
+            for t, p, m in entries
+        )
+
+        last_time, last_progress, last_message = entries[-1]
+        self._overall_progress = max(0.0, min(100.0, last_progress))
+        self._status_message = last_message
+        self._last_update_time = last_time
+
+        # Update UI
+        self._update_progress_displays()
+        self._log_progress(f"{self._overall_progress:.1f}% - {last_message}")
+
+        # Emit signal
+        self.progress_updated.emit(last_progress, last_message)
+
     def finish_processing(self, success: bool = True, final_message: str = "Processing completed") -> None:
         """
         Finish progress tracking.
@@ -553,7 +587,9 @@ class ProgressWidget(QWidget):
             return
             
         # Calculate current speed (progress per minute)
-        recent_entries = self._progress_history[-5:]  # Last 5 entries
+        recent_entries = list(islice(  # Last 5 entries
+            self._progress_history, max(0, len(self._progress_history) - 5), None
+        ))
         if len(recent_entries) >= 2:
             time_diff = recent_entries[-1]['time'] - recent_entries[0]['time']
             progress_diff = recent_entries[-1]['progress'] - recent_entries[0]['progress']
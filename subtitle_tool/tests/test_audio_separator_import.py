@@ -0,0 +1,24 @@
+"""
+Smoke tests for the audio-separator and NumPy dependencies.
+
+Both tests are skipped rather than failed when the package is not
+installed, so the module can run on light CI images.
+"""
+
+import pytest
+
+
+def test_audio_separator():
+    """audio-separator imports and exposes the Separator class."""
+    # Import only: a real Separator() loads the torch/ONNX backends and may
+    # fetch the model index, which is too heavy for a smoke test
+    separator_module = pytest.importorskip("audio_separator.separator")
+
+    assert isinstance(separator_module.Separator, type)
+
+
+def test_numpy():
+    """NumPy imports and reports a version."""
+    np = pytest.importorskip("numpy")
+
+    assert np.__version__
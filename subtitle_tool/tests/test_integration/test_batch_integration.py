@@ -6,7 +6,6 @@ file queue management, progress tracking, and error handling.
 """
 
 import pytest
-import os
 import tempfile
 import shutil
 from unittest.mock import Mock, patch, MagicMock
@@ -22,23 +21,15 @@ from src.models.data_models import (
 class TestBatchProcessingIntegration:
     """Integration tests for complete batch processing workflow."""
     
-    @pytest.fixture
-    def temp_audio_files(self):
-        """Create temporary audio files for testing."""
-        files = []
-        for i in range(3):
-            with tempfile.NamedTemporaryFile(suffix='.wav', delete=False) as f:
-                f.write(b"fake audio data for testing")
-                files.append(f.name)
-        
-        yield files
-        
-        # Cleanup
-        for file_path in files:
-            try:
-                os.unlink(file_path)
-            except FileNotFoundError:
-                pass
+    @pytest.fixture(scope="session")
+    def temp_audio_files(self, tmp_path_factory):
+        """Create the fake audio files once per session; tests only read them."""
+        audio_dir = tmp_path_factory.mktemp("batch_audio", numbered=False)
+        paths = [audio_dir / f"audio_{i}.wav" for i in range(3)]
+        for path in paths:
+            path.write_bytes(b"fake audio data for testing")
+        
+        return [str(path) for path in paths]
     
     @pytest.fixture
     def temp_output_dir(self):
@@ -47,9 +38,9 @@ class TestBatchProcessingIntegration:
         yield temp_dir
         shutil.rmtree(temp_dir, ignore_errors=True)
     
-    @pytest.fixture
-    def mock_audio_processor(self):
-        """Create a mock audio processor for integration testing."""
+    @pytest.fixture(scope="module")
+    def shared_audio_processor(self):
+        """Create a mock audio processor for integration testing, once per module."""
         processor = Mock()
         
         # Configure successful processing
@@ -80,6 +71,12 @@ class TestBatchProcessingIntegration:
         
         return processor
     
+    @pytest.fixture
+    def mock_audio_processor(self, shared_audio_processor):
+        """Yield the shared mock processor, clearing calls and side effects afterwards."""
+        yield shared_audio_processor
+        shared_audio_processor.reset_mock(return_value=False, side_effect=True)
+    
     def test_complete_batch_workflow(self, temp_audio_files, temp_output_dir, mock_audio_processor):
         """Test complete batch processing workflow from start to finish."""
         # Create batch processor
@@ -21,9 +21,9 @@ from src.models.data_models import (
 class TestBatchReportingIntegration:
     """Integration tests for batch processing reporting."""
     
-    @pytest.fixture
-    def mock_audio_processor(self):
-        """Create a mock audio processor for integration tests."""
+    @pytest.fixture(scope="module")
+    def shared_audio_processor(self):
+        """Create a mock audio processor for integration tests, once per module."""
         processor = Mock()
         processor.validate_audio_file.return_value = Mock(
             path="/test/audio.wav",
@@ -41,28 +41,26 @@ class TestBatchReportingIntegration:
         )
         return processor
     
+    @pytest.fixture
+    def mock_audio_processor(self, shared_audio_processor):
+        """Yield the shared mock processor, clearing calls and side effects afterwards."""
+        yield shared_audio_processor
+        shared_audio_processor.reset_mock(return_value=False, side_effect=True)
+    
     @pytest.fixture
     def batch_processor(self, mock_audio_processor):
         """Create a BatchProcessor instance for integration tests."""
         return BatchProcessor(audio_processor=mock_audio_processor)
     
-    @pytest.fixture
-    def temp_audio_files(self):
-        """Create temporary audio files for testing."""
-        files = []
-        for i in range(3):
-            with tempfile.NamedTemporaryFile(suffix='.wav', delete=False) as f:
-                f.write(b"fake audio data for integration test")
-                files.append(f.name)
-        
-        yield files
+    @pytest.fixture(scope="session")
+    def temp_audio_files(self, tmp_path_factory):
+        """Create the fake audio files once per session; tests only read them."""
+        audio_dir = tmp_path_factory.mktemp("batch_report_audio", numbered=False)
+        paths = [audio_dir / f"audio_{i}.wav" for i in range(3)]
+        for path in paths:
+            path.write_bytes(b"fake audio data for integration test")
         
-        # Cleanup
-        for file_path in files:
-            try:
-                os.unlink(file_path)
-            except FileNotFoundError:
-                pass
+        return [str(path) for path in paths]
     
     def test_complete_batch_reporting_workflow(self, batch_processor, temp_audio_files):
         """Test complete batch processing workflow with reporting."""
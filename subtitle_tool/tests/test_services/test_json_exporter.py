@@ -3,72 +3,78 @@ Tests for JSON exporter functionality.
 """
 
 import json
+import math
 import pytest
-from datetime import datetime
+from datetime import datetime, timezone
+from types import SimpleNamespace
+from src.services import json_exporter
 from src.services.json_exporter import JSONExporter
 from src.models.data_models import AlignmentData, Segment, WordSegment
 
 
+def _build_test_alignment_data():
+    """Build the segments, word segments and alignment data shared by the tests."""
+    segments = [
+        Segment(
+            start_time=0.0,
+            end_time=2.5,
+            text="Hello world",
+            confidence=0.95,
+            segment_id=1
+        ),
+        Segment(
+            start_time=2.5,
+            end_time=5.0,
+            text="This is a test",
+            confidence=0.88,
+            segment_id=2
+        ),
+        Segment(
+            start_time=5.0,
+            end_time=7.2,
+            text="JSON export format",
+            confidence=0.92,
+            segment_id=3
+        )
+    ]
+    
+    word_segments = [
+        WordSegment(word="Hello", start_time=0.0, end_time=0.5, confidence=0.95, segment_id=1),
+        WordSegment(word="world", start_time=0.5, end_time=1.0, confidence=0.93, segment_id=1),
+        WordSegment(word="This", start_time=2.5, end_time=2.8, confidence=0.90, segment_id=2),
+        WordSegment(word="is", start_time=2.8, end_time=3.0, confidence=0.88, segment_id=2),
+        WordSegment(word="a", start_time=3.0, end_time=3.1, confidence=0.85, segment_id=2),
+        WordSegment(word="test", start_time=3.1, end_time=3.5, confidence=0.92, segment_id=2),
+        WordSegment(word="JSON", start_time=5.0, end_time=5.5, confidence=0.91, segment_id=3),
+        WordSegment(word="export", start_time=5.5, end_time=6.0, confidence=0.89, segment_id=3),
+        WordSegment(word="format", start_time=6.0, end_time=6.5, confidence=0.93, segment_id=3),
+    ]
+    
+    alignment = AlignmentData(
+        segments=segments,
+        word_segments=word_segments,
+        confidence_scores=[0.95, 0.88, 0.92],
+        audio_duration=7.2,
+        source_file="test_audio.wav"
+    )
+    
+    return SimpleNamespace(segments=segments, word_segments=word_segments, alignment=alignment)
+
+
+@pytest.fixture(scope="module")
+def alignment_fixture():
+    """Exporter and test data shared by the module; tests must not mutate them."""
+    fixture = _build_test_alignment_data()
+    fixture.exporter = JSONExporter()
+    return fixture
+
+
 class TestJSONExporter:
     """Test cases for JSON exporter."""
     
-    def setup_method(self):
-        """Set up test fixtures."""
-        self.exporter = JSONExporter()
-        
-        # Create test segments
-        self.test_segments = [
-            Segment(
-                start_time=0.0,
-                end_time=2.5,
-                text="Hello world",
-                confidence=0.95,
-                segment_id=1
-            ),
-            Segment(
-                start_time=2.5,
-                end_time=5.0,
-                text="This is a test",
-                confidence=0.88,
-                segment_id=2
-            ),
-            Segment(
-                start_time=5.0,
-                end_time=7.2,
-                text="JSON export format",
-                confidence=0.92,
-                segment_id=3
-            )
-        ]
-        
-        # Create test word segments
-        self.test_word_segments = [
-            WordSegment(word="Hello", start_time=0.0, end_time=0.5, confidence=0.95, segment_id=1),
-            WordSegment(word="world", start_time=0.5, end_time=1.0, confidence=0.93, segment_id=1),
-            WordSegment(word="This", start_time=2.5, end_time=2.8, confidence=0.90, segment_id=2),
-            WordSegment(word="is", start_time=2.8, end_time=3.0, confidence=0.88, segment_id=2),
-            WordSegment(word="a", start_time=3.0, end_time=3.1, confidence=0.85, segment_id=2),
-            WordSegment(word="test", start_time=3.1, end_time=3.5, confidence=0.92, segment_id=2),
-            WordSegment(word="JSON", start_time=5.0, end_time=5.5, confidence=0.91, segment_id=3),
-            WordSegment(word="export", start_time=5.5, end_time=6.0, confidence=0.89, segment_id=3),
-            WordSegment(word="format", start_time=6.0, end_time=6.5, confidence=0.93, segment_id=3),
-        ]
-        
-        # Create test alignment data
-        self.test_alignment_data = AlignmentData(
-            segments=self.test_segments,
-            word_segments=self.test_word_segments,
-            confidence_scores=[0.95, 0.88, 0.92],
-            audio_duration=7.2,
-            source_file="test_audio.wav"
-        )
-    
-    def test_export_alignment_data_basic(self):
+    def test_export_alignment_data_basic(self, alignment_fixture):
         """Test basic alignment data export."""
-        result = self.exporter.export_alignment_data(self.test_alignment_data)
-        
-        # Parse JSON to verify structure
-        data = json.loads(result)
+        data = alignment_fixture.exporter.build_alignment_payload(alignment_fixture.alignment)
         
         # Check main structure
         assert "metadata" in data
@@ -92,33 +98,46 @@ class TestJSONExporter:
         assert data["audio"]["duration"] == 7.2
         assert data["audio"]["source_file"] == "test_audio.wav"
     
-    def test_export_alignment_data_without_metadata(self):
+    def test_export_alignment_data_without_metadata(self, alignment_fixture):
         """Test alignment data export without metadata."""
-        result = self.exporter.export_alignment_data(
-            self.test_alignment_data, 
+        data = alignment_fixture.exporter.build_alignment_payload(
+            alignment_fixture.alignment, 
             include_metadata=False
         )
         
-        data = json.loads(result)
         assert "metadata" not in data
         assert "segments" in data
         assert "word_segments" in data
     
-    def test_export_alignment_data_without_statistics(self):
+    def test_export_alignment_data_without_statistics(self, alignment_fixture):
         """Test alignment data export without statistics."""
-        result = self.exporter.export_alignment_data(
-            self.test_alignment_data, 
+        data = alignment_fixture.exporter.build_alignment_payload(
+            alignment_fixture.alignment, 
             include_statistics=False
         )
         
-        data = json.loads(result)
         assert "statistics" not in data
         assert "segments" in data
         assert "word_segments" in data
     
-    def test_export_segments_only(self):
+    def test_build_alignment_payload_returns_independent_copy(self, alignment_fixture):
+        """Test that modifying a built payload does not leak into later exports."""
+        exporter = alignment_fixture.exporter
+        first = exporter.build_alignment_payload(alignment_fixture.alignment)
+        first["segments"][0]["text"] = "Tampered"
+        first["confidence_scores"].append(0.0)
+        first["audio"]["duration"] = -1.0
+        first["statistics"].clear()
+        
+        second = exporter.build_alignment_payload(alignment_fixture.alignment)
+        assert second["segments"][0]["text"] == "Hello world"
+        assert second["confidence_scores"] == [0.95, 0.88, 0.92]
+        assert second["audio"]["duration"] == 7.2
+        assert second["statistics"]
+    
+    def test_export_segments_only(self, alignment_fixture):
         """Test segments-only export."""
-        result = self.exporter.export_segments_only(self.test_alignment_data)
+        result = alignment_fixture.exporter.export_segments_only(alignment_fixture.alignment)
         
         data = json.loads(result)
         
@@ -133,9 +152,9 @@ class TestJSONExporter:
         assert data["audio_duration"] == 7.2
         assert len(data["segments"]) == 3
     
-    def test_export_words_only(self):
+    def test_export_words_only(self, alignment_fixture):
         """Test words-only export."""
-        result = self.exporter.export_words_only(self.test_alignment_data)
+        result = alignment_fixture.exporter.export_words_only(alignment_fixture.alignment)
         
         data = json.loads(result)
         
@@ -150,9 +169,9 @@ class TestJSONExporter:
         assert data["audio_duration"] == 7.2
         assert len(data["word_segments"]) == 9
     
-    def test_export_subtitle_format_segments(self):
+    def test_export_subtitle_format_segments(self, alignment_fixture):
         """Test subtitle format export with segments."""
-        result = self.exporter.export_subtitle_format(self.test_alignment_data, "segments")
+        result = alignment_fixture.exporter.export_subtitle_format(alignment_fixture.alignment, "segments")
         
         data = json.loads(result)
         
@@ -172,9 +191,9 @@ class TestJSONExporter:
         assert "duration" in subtitle
         assert "confidence" in subtitle
     
-    def test_export_subtitle_format_words(self):
+    def test_export_subtitle_format_words(self, alignment_fixture):
         """Test subtitle format export with words."""
-        result = self.exporter.export_subtitle_format(self.test_alignment_data, "words")
+        result = alignment_fixture.exporter.export_subtitle_format(alignment_fixture.alignment, "words")
         
         data = json.loads(result)
         
@@ -193,9 +212,9 @@ class TestJSONExporter:
         assert "confidence" in word
         assert "segment_id" in word
     
-    def test_export_subtitle_format_both(self):
+    def test_export_subtitle_format_both(self, alignment_fixture):
         """Test subtitle format export with both segments and words."""
-        result = self.exporter.export_subtitle_format(self.test_alignment_data, "both")
+        result = alignment_fixture.exporter.export_subtitle_format(alignment_fixture.alignment, "both")
         
         data = json.loads(result)
         
@@ -207,9 +226,9 @@ class TestJSONExporter:
         assert len(data["subtitles"]) == 3
         assert len(data["words"]) == 9
     
-    def test_export_for_editing(self):
+    def test_export_for_editing(self, alignment_fixture):
         """Test export optimized for editing."""
-        result = self.exporter.export_for_editing(self.test_alignment_data)
+        result = alignment_fixture.exporter.export_for_editing(alignment_fixture.alignment)
         
         data = json.loads(result)
         
@@ -244,10 +263,10 @@ class TestJSONExporter:
         assert "end_time" in word
         assert "confidence" in word
     
-    def test_segment_to_dict(self):
+    def test_segment_to_dict(self, alignment_fixture):
         """Test segment to dictionary conversion."""
-        segment = self.test_segments[0]
-        result = self.exporter._segment_to_dict(segment)
+        segment = alignment_fixture.segments[0]
+        result = alignment_fixture.exporter._segment_to_dict(segment)
         
         assert result["start_time"] == 0.0
         assert result["end_time"] == 2.5
@@ -256,10 +275,10 @@ class TestJSONExporter:
         assert result["confidence"] == 0.95
         assert result["segment_id"] == 1
     
-    def test_word_segment_to_dict(self):
+    def test_word_segment_to_dict(self, alignment_fixture):
         """Test word segment to dictionary conversion."""
-        word_segment = self.test_word_segments[0]
-        result = self.exporter._word_segment_to_dict(word_segment)
+        word_segment = alignment_fixture.word_segments[0]
+        result = alignment_fixture.exporter._word_segment_to_dict(word_segment)
         
         assert result["word"] == "Hello"
         assert result["start_time"] == 0.0
@@ -268,9 +287,9 @@ class TestJSONExporter:
         assert result["confidence"] == 0.95
         assert result["segment_id"] == 1
     
-    def test_generate_metadata(self):
+    def test_generate_metadata(self, alignment_fixture):
         """Test metadata generation."""
-        result = self.exporter._generate_metadata(self.test_alignment_data)
+        result = alignment_fixture.exporter._generate_metadata(alignment_fixture.alignment)
         
         assert "export_timestamp" in result
         assert result["format_version"] == "1.0"
@@ -281,9 +300,9 @@ class TestJSONExporter:
         assert result["source_file"] == "test_audio.wav"
         assert "average_confidence" in result
     
-    def test_generate_statistics(self):
+    def test_generate_statistics(self, alignment_fixture):
         """Test statistics generation."""
-        result = self.exporter._generate_statistics(self.test_alignment_data)
+        result = alignment_fixture.exporter._generate_statistics(alignment_fixture.alignment)
         
         # Check structure
         assert "segments" in result
@@ -309,9 +328,9 @@ class TestJSONExporter:
         assert "medium_confidence_segments" in quality
         assert "low_confidence_segments" in quality
     
-    def test_group_words_by_segments(self):
+    def test_group_words_by_segments(self, alignment_fixture):
         """Test grouping words by segments."""
-        result = self.exporter._group_words_by_segments(self.test_alignment_data)
+        result = alignment_fixture.exporter._group_words_by_segments(alignment_fixture.alignment)
         
         # Check that words are grouped correctly
         assert 1 in result  # segment_id 1
@@ -334,7 +353,7 @@ class TestJSONExporter:
         assert segment.segment_id == 3
         assert len(words) == 3  # "JSON", "export", "format"
     
-    def test_validate_json_content_valid(self):
+    def test_validate_json_content_valid(self, alignment_fixture):
         """Test validation of valid JSON content."""
         valid_json = json.dumps({
             "segments": [
@@ -353,24 +372,24 @@ class TestJSONExporter:
             ]
         })
         
-        errors = self.exporter.validate_json_content(valid_json)
+        errors = alignment_fixture.exporter.validate_json_content(valid_json)
         assert len(errors) == 0
     
-    def test_validate_json_content_invalid_json(self):
+    def test_validate_json_content_invalid_json(self, alignment_fixture):
         """Test validation of invalid JSON."""
         invalid_json = "{ invalid json }"
         
-        errors = self.exporter.validate_json_content(invalid_json)
+        errors = alignment_fixture.exporter.validate_json_content(invalid_json)
         assert len(errors) > 0
         assert "Invalid JSON format" in errors[0]
     
-    def test_validate_json_content_empty(self):
+    def test_validate_json_content_empty(self, alignment_fixture):
         """Test validation of empty JSON content."""
-        errors = self.exporter.validate_json_content("")
+        errors = alignment_fixture.exporter.validate_json_content("")
         assert len(errors) > 0
         assert "JSON content is empty" in errors[0]
     
-    def test_validate_json_content_missing_fields(self):
+    def test_validate_json_content_missing_fields(self, alignment_fixture):
         """Test validation of JSON with missing required fields."""
         invalid_json = json.dumps({
             "segments": [
@@ -381,17 +400,17 @@ class TestJSONExporter:
             ]
         })
         
-        errors = self.exporter.validate_json_content(invalid_json)
+        errors = alignment_fixture.exporter.validate_json_content(invalid_json)
         assert len(errors) > 0
         assert "missing required field" in str(errors)
     
-    def test_parse_json_to_alignment_data(self):
+    def test_parse_json_to_alignment_data(self, alignment_fixture):
         """Test parsing JSON back to AlignmentData."""
         # First export to JSON
-        json_content = self.exporter.export_alignment_data(self.test_alignment_data)
+        json_content = alignment_fixture.exporter.export_alignment_data(alignment_fixture.alignment)
         
         # Then parse back
-        result = self.exporter.parse_json_to_alignment_data(json_content)
+        result = alignment_fixture.exporter.parse_json_to_alignment_data(json_content)
         
         # Check that data is preserved
         assert len(result.segments) == 3
@@ -413,17 +432,17 @@ class TestJSONExporter:
         assert word.end_time == 0.5
         assert word.confidence == 0.95
     
-    def test_parse_json_invalid_content(self):
+    def test_parse_json_invalid_content(self, alignment_fixture):
         """Test parsing invalid JSON content."""
         with pytest.raises(ValueError, match="Invalid JSON content"):
-            self.exporter.parse_json_to_alignment_data("{ invalid }")
+            alignment_fixture.exporter.parse_json_to_alignment_data("{ invalid }")
     
-    def test_export_subtitle_format_invalid_type(self):
+    def test_export_subtitle_format_invalid_type(self, alignment_fixture):
         """Test subtitle format export with invalid type."""
         with pytest.raises(ValueError, match="format_type must be"):
-            self.exporter.export_subtitle_format(self.test_alignment_data, "invalid")
+            alignment_fixture.exporter.export_subtitle_format(alignment_fixture.alignment, "invalid")
     
-    def test_empty_alignment_data(self):
+    def test_empty_alignment_data(self, alignment_fixture):
         """Test handling of empty alignment data."""
         empty_data = AlignmentData(
             segments=[],
@@ -433,23 +452,26 @@ class TestJSONExporter:
         )
         
         with pytest.raises(ValueError, match="must contain at least one segment"):
-            self.exporter.export_segments_only(empty_data)
+            alignment_fixture.exporter.export_segments_only(empty_data)
         
         with pytest.raises(ValueError, match="must contain at least one word segment"):
-            self.exporter.export_words_only(empty_data)
+            alignment_fixture.exporter.export_words_only(empty_data)
     
-    def test_none_alignment_data(self):
+    def test_none_alignment_data(self, alignment_fixture):
         """Test handling of None alignment data."""
         with pytest.raises(ValueError, match="cannot be None"):
-            self.exporter.export_alignment_data(None)
+            alignment_fixture.exporter.export_alignment_data(None)
+        
+        with pytest.raises(ValueError, match="cannot be None"):
+            alignment_fixture.exporter.build_alignment_payload(None)
         
         with pytest.raises(ValueError, match="cannot be None"):
-            self.exporter.export_subtitle_format(None)
+            alignment_fixture.exporter.export_subtitle_format(None)
         
         with pytest.raises(ValueError, match="cannot be None"):
-            self.exporter.export_for_editing(None)
+            alignment_fixture.exporter.export_for_editing(None)
     
-    def test_unicode_text_handling(self):
+    def test_unicode_text_handling(self, alignment_fixture):
         """Test handling of Unicode text in JSON export."""
         unicode_segment = Segment(
             start_time=0.0,
@@ -466,7 +488,7 @@ class TestJSONExporter:
             audio_duration=2.0
         )
         
-        result = self.exporter.export_alignment_data(unicode_alignment_data)
+        result = alignment_fixture.exporter.export_alignment_data(unicode_alignment_data)
         
         # Parse back to verify Unicode is preserved
         data = json.loads(result)
@@ -475,7 +497,7 @@ class TestJSONExporter:
         assert "العربية" in data["segments"][0]["text"]
         assert "русский" in data["segments"][0]["text"]
     
-    def test_precision_rounding(self):
+    def test_precision_rounding(self, alignment_fixture):
         """Test that floating point values are properly rounded."""
         precise_segment = Segment(
             start_time=1.23456789,
@@ -492,7 +514,7 @@ class TestJSONExporter:
             audio_duration=2.98765432
         )
         
-        result = self.exporter.export_alignment_data(precise_alignment_data)
+        result = alignment_fixture.exporter.export_alignment_data(precise_alignment_data)
         data = json.loads(result)
         
         # Check that values are rounded to 3 decimal places
@@ -501,7 +523,7 @@ class TestJSONExporter:
         assert segment["end_time"] == 2.988
         assert segment["confidence"] == 0.877
     
-    def test_empty_statistics_handling(self):
+    def test_empty_statistics_handling(self, alignment_fixture):
         """Test statistics generation with empty data."""
         empty_data = AlignmentData(
             segments=[],
@@ -510,5 +532,143 @@ class TestJSONExporter:
             audio_duration=0.0
         )
         
-        result = self.exporter._generate_statistics(empty_data)
-        assert result == {}  # Should return empty dict for empty data
\ No newline at end of file
+        result = alignment_fixture.exporter._generate_statistics(empty_data)
+        assert result == {}  # Should return empty dict for empty data
+    
+    def test_export_reflects_in_place_changes(self, alignment_fixture):
+        """Test that re-exporting edited alignment data picks up the edits."""
+        # Uses its own data since it mutates it
+        alignment = _build_test_alignment_data().alignment
+        alignment_fixture.exporter.export_alignment_data(alignment)
+        
+        alignment.segments[0].text = "Changed text"
+        alignment.segments.append(
+            Segment(start_time=7.2, end_time=8.0, text="Appended", confidence=0.9, segment_id=4)
+        )
+        
+        data = json.loads(alignment_fixture.exporter.export_alignment_data(alignment))
+        assert data["segments"][0]["text"] == "Changed text"
+        assert data["segments"][-1]["text"] == "Appended"
+    
+    def test_export_timestamp_format(self, alignment_fixture):
+        """Test that export timestamps are UTC ISO-8601 strings."""
+        result = alignment_fixture.exporter._generate_metadata(alignment_fixture.alignment)
+        
+        timestamp = result["export_timestamp"]
+        assert timestamp.endswith("Z")
+        parsed = datetime.strptime(timestamp, "%Y-%m-%dT%H:%M:%S.%fZ").replace(tzinfo=timezone.utc)
+        assert abs((datetime.now(timezone.utc) - parsed).total_seconds()) < 60
+    
+    def test_duration_matches_rounded_times(self, alignment_fixture):
+        """Test that exported durations equal the difference of exported times."""
+        segment = Segment(
+            start_time=1.0004,
+            end_time=2.0006,
+            text="Quantized",
+            confidence=0.9,
+            segment_id=1
+        )
+        result = alignment_fixture.exporter._segment_to_dict(segment)
+        
+        assert result["start_time"] == 1.0
+        assert result["end_time"] == 2.001
+        assert result["duration"] == 1.001
+    
+    def test_export_formats_agree_on_quantized_times(self, alignment_fixture):
+        """Test that every export format quantizes times the same way."""
+        exporter = alignment_fixture.exporter
+        alignment = AlignmentData(
+            segments=[Segment(start_time=0.0105, end_time=1.0, text="Hello", confidence=0.9, segment_id=0)],
+            word_segments=[WordSegment(word="Hello", start_time=0.0105, end_time=1.0, confidence=0.9, segment_id=0)],
+            confidence_scores=[0.9],
+            audio_duration=1.0,
+            source_file="test_audio.wav"
+        )
+        
+        full = json.loads(exporter.export_alignment_data(alignment))
+        subtitle = json.loads(exporter.export_subtitle_format(alignment, "both"))
+        editing = json.loads(exporter.export_for_editing(alignment))
+        bilingual = json.loads(exporter.export_bilingual_alignment_data(alignment, "es"))
+        
+        expected = full["segments"][0]["start_time"]
+        assert full["word_segments"][0]["start_time"] == expected
+        assert subtitle["subtitles"][0]["start"] == expected
+        assert subtitle["words"][0]["start"] == expected
+        assert editing["segments"][0]["start_time"] == expected
+        assert editing["segments"][0]["words"][0]["start_time"] == expected
+        assert bilingual["segments"][0]["start_time"] == expected
+    
+    def test_export_and_parse_without_msgspec(self, alignment_fixture, monkeypatch):
+        """Test that export and parsing fall back to the json module without msgspec."""
+        monkeypatch.setattr(json_exporter, "msgspec", None)
+        exporter = JSONExporter()
+        
+        json_content = exporter.export_alignment_data(alignment_fixture.alignment)
+        result = exporter.parse_json_to_alignment_data(json_content)
+        
+        assert len(result.segments) == 3
+        assert len(result.word_segments) == 9
+        assert result.source_file == "test_audio.wav"
+    
+    def test_parse_json_missing_text_field(self, alignment_fixture):
+        """Test that parsing reports missing segment text as invalid content."""
+        invalid_json = json.dumps({
+            "segments": [{"start_time": 0.0, "end_time": 1.0}]
+        })
+        
+        with pytest.raises(ValueError, match="Invalid JSON content"):
+            alignment_fixture.exporter.parse_json_to_alignment_data(invalid_json)
+    
+    def test_parsed_confidence_scores_are_list(self, alignment_fixture):
+        """Test that parsed confidence scores compare equal to a plain list."""
+        json_content = alignment_fixture.exporter.export_alignment_data(alignment_fixture.alignment)
+        
+        result = alignment_fixture.exporter.parse_json_to_alignment_data(json_content)
+        assert isinstance(result.confidence_scores, list)
+        assert result.confidence_scores == [0.95, 0.88, 0.92]
+    
+    def test_export_numpy_scores(self, alignment_fixture):
+        """Test that numpy scalar scores, as produced by alignment models, are exported."""
+        np = pytest.importorskip("numpy")
+        alignment = AlignmentData(
+            segments=[Segment(start_time=0.0, end_time=1.0, text="Hello", confidence=np.float64(0.9), segment_id=0)],
+            word_segments=[WordSegment(word="Hello", start_time=0.0, end_time=1.0, confidence=np.float32(0.75), segment_id=0)],
+            confidence_scores=[np.float64(0.9), np.float32(0.75)],
+            audio_duration=1.0,
+            source_file="test_audio.wav"
+        )
+        
+        json_content = alignment_fixture.exporter.export_alignment_data(alignment)
+        result = alignment_fixture.exporter.parse_json_to_alignment_data(json_content)
+        
+        assert result.segments[0].confidence == 0.9
+        assert result.word_segments[0].confidence == 0.75
+        assert result.confidence_scores == [0.9, 0.75]
+    
+    def test_export_and_parse_nan_confidence(self, alignment_fixture):
+        """Test that a NaN confidence survives an export and re-import."""
+        alignment = AlignmentData(
+            segments=[Segment(start_time=0.0, end_time=1.0, text="Hello", confidence=0.9, segment_id=0)],
+            word_segments=[WordSegment(word="Hello", start_time=0.0, end_time=1.0, confidence=float("nan"), segment_id=0)],
+            confidence_scores=[float("nan")],
+            audio_duration=1.0,
+            source_file="test_audio.wav"
+        )
+        
+        json_content = alignment_fixture.exporter.export_alignment_data(alignment)
+        result = alignment_fixture.exporter.parse_json_to_alignment_data(json_content)
+        
+        assert math.isnan(result.word_segments[0].confidence)
+        assert math.isnan(result.confidence_scores[0])
+    
+    def test_export_indent_opt_in(self, alignment_fixture):
+        """Test that exports are compact by default and indented on request."""
+        compact = alignment_fixture.exporter.export_alignment_data(alignment_fixture.alignment)
+        indented = alignment_fixture.exporter.export_alignment_data(
+            alignment_fixture.alignment,
+            indent=True
+        )
+        
+        assert "\n" not in compact
+        assert '\n  "segments": [' in indented
+        assert json.loads(compact)["segments"] == json.loads(indented)["segments"]
@@ -2,34 +2,112 @@
 Tests for the ModelManager service.
 """
 
+import hashlib
+import io
+import os
+import re
 import pytest
-import tempfile
 import shutil
 from pathlib import Path
-from unittest.mock import Mock, patch
+from unittest.mock import AsyncMock, Mock, patch
 
 from src.services.model_manager import ModelManager
+from src.services.model_downloader import DownloadResult
 from src.services.interfaces import ModelType
 from src.models.data_models import ModelSize
 
 
+_HEX64 = re.compile(r"[0-9a-f]{64}")
+
+
+def _touch(path: Path, data: bytes = b"mock model content") -> Path:
+    """Create a file with the given bytes, creating parent directories as needed."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        os.write(fd, data)
+    finally:
+        os.close(fd)
+    return path
+
+
+@pytest.fixture(scope="module")
+def prebuilt_models(fs_module):
+    """Build the model file scaffold shared by the tests once per module."""
+    root = Path("/prebuilt_models")
+    _touch(root / "whisperx" / "base.pt")
+    return root
+
+
+@pytest.fixture(scope="module")
+def temp_models_dir(fs_module):
+    """Models directory on the in-memory fake filesystem shared by the module."""
+    return Path("/models")
+
+
+@pytest.fixture
+def real_tmp_path(fs_module, tmp_path_factory):
+    """Temporary directory on the real filesystem for tests the fake one cannot serve."""
+    fs_module.pause()
+    try:
+        yield tmp_path_factory.mktemp("real_fs")
+    finally:
+        fs_module.resume()
+
+
+@pytest.fixture(scope="module")
+def model_manager(temp_models_dir):
+    """Create ModelManager instance with temporary directory shared by the module."""
+    return ModelManager(models_dir=temp_models_dir)
+
+
+@pytest.fixture
+def mock_downloader_class():
+    """Patch the ModelDownloader class used by ModelManager.download_model."""
+    with patch('src.services.model_downloader.ModelDownloader') as downloader_class:
+        yield downloader_class
+
+
+@pytest.fixture
+def mock_downloader(mock_downloader_class):
+    """Mock ModelDownloader instance returned by the patched class."""
+    downloader = Mock()
+    mock_downloader_class.return_value = downloader
+    return downloader
+
+
+@pytest.fixture
+def whisperx_base_model(prebuilt_models, temp_models_dir):
+    """Link the prebuilt whisperx base model into the models directory."""
+    source = prebuilt_models / "whisperx" / "base.pt"
+    target = temp_models_dir / "whisperx" / "base.pt"
+    target.parent.mkdir(parents=True, exist_ok=True)
+    try:
+        os.link(source, target)
+    except OSError:
+        shutil.copy2(source, target)
+    return target
+
+
 class TestModelManager:
     """Test cases for ModelManager class."""
     
-    @pytest.fixture
-    def temp_models_dir(self):
-        """Create a temporary directory for models."""
-        temp_dir = tempfile.mkdtemp()
-        yield Path(temp_dir)
-        shutil.rmtree(temp_dir)
-    
-    @pytest.fixture
-    def model_manager(self, temp_models_dir):
-        """Create ModelManager instance with temporary directory."""
-        with patch('src.services.model_manager.config_manager') as mock_config:
-            mock_config.get_config.return_value.models_directory = str(temp_models_dir)
-            manager = ModelManager()
-            return manager
+    @pytest.fixture(autouse=True)
+    def reset_model_manager(self, model_manager, temp_models_dir):
+        """Reset the shared manager state and empty the models directory around each test."""
+        model_manager.invalidate_availability_cache()
+        model_manager._download_progress_callback = None
+        
+        for child in temp_models_dir.iterdir():
+            if child.is_dir():
+                shutil.rmtree(child, ignore_errors=True)
+            else:
+                child.unlink()
+        
+        yield
+        
+        # Drop anything the test memoized so the module-scoped manager stays safe to reuse
+        model_manager.invalidate_availability_cache()
     
     def test_init_creates_models_directory(self, model_manager, temp_models_dir):
         """Test that ModelManager creates models directory on initialization."""
@@ -41,27 +119,15 @@ class TestModelManager:
         result = model_manager.check_model_availability(ModelType.WHISPERX, ModelSize.BASE)
         assert result is False
     
-    def test_check_model_availability_existing_model(self, model_manager, temp_models_dir):
+    def test_check_model_availability_existing_model(self, model_manager, whisperx_base_model):
         """Test checking availability of existing model."""
-        # Create a mock model file
-        whisperx_dir = temp_models_dir / "whisperx"
-        whisperx_dir.mkdir(parents=True, exist_ok=True)
-        model_file = whisperx_dir / "base.pt"
-        model_file.write_text("mock model content")
-        
         result = model_manager.check_model_availability(ModelType.WHISPERX, ModelSize.BASE)
         assert result is True
     
-    def test_get_model_path_existing_model(self, model_manager, temp_models_dir):
+    def test_get_model_path_existing_model(self, model_manager, whisperx_base_model):
         """Test getting path for existing model."""
-        # Create a mock model file
-        whisperx_dir = temp_models_dir / "whisperx"
-        whisperx_dir.mkdir(parents=True, exist_ok=True)
-        model_file = whisperx_dir / "base.pt"
-        model_file.write_text("mock model content")
-        
         path = model_manager.get_model_path(ModelType.WHISPERX, ModelSize.BASE)
-        assert path == str(model_file)
+        assert path == str(whisperx_base_model)
     
     def test_get_model_path_missing_model(self, model_manager):
         """Test getting path for non-existent model raises FileNotFoundError."""
@@ -73,17 +139,11 @@ class TestModelManager:
         available = model_manager.list_available_models()
         assert available == {}
     
-    def test_list_available_models_with_models(self, model_manager, temp_models_dir):
+    def test_list_available_models_with_models(self, model_manager, temp_models_dir, whisperx_base_model):
         """Test listing available models when some exist."""
         # Create mock model files
-        whisperx_dir = temp_models_dir / "whisperx"
-        whisperx_dir.mkdir(parents=True, exist_ok=True)
-        (whisperx_dir / "base.pt").write_text("mock base model")
-        (whisperx_dir / "small.pt").write_text("mock small model")
-        
-        demucs_dir = temp_models_dir / "demucs"
-        demucs_dir.mkdir(parents=True, exist_ok=True)
-        (demucs_dir / "htdemucs.th").write_text("mock demucs model")
+        _touch(temp_models_dir / "whisperx" / "small.pt")
+        _touch(temp_models_dir / "demucs" / "htdemucs.th")
         
         available = model_manager.list_available_models()
         
@@ -106,46 +166,30 @@ class TestModelManager:
         directory = model_manager.get_models_directory()
         assert directory == str(temp_models_dir)
     
-    def test_calculate_file_checksum(self, model_manager, temp_models_dir):
+    def test_calculate_file_checksum(self, model_manager):
         """Test calculating file checksum."""
-        test_file = temp_models_dir / "test.txt"
-        test_content = "test content for checksum"
-        test_file.write_text(test_content)
-        
-        checksum = model_manager._calculate_file_checksum(test_file)
+        checksum = model_manager._hash_stream(io.BytesIO(b"test content for checksum"))
         
         # Verify it's a valid SHA256 hash (64 hex characters)
-        assert len(checksum) == 64
-        assert all(c in "0123456789abcdef" for c in checksum)
+        assert _HEX64.fullmatch(checksum)
     
-    def test_verify_model_integrity_no_checksum(self, model_manager, temp_models_dir):
+    def test_verify_model_integrity_no_checksum(self, model_manager, whisperx_base_model):
         """Test model integrity verification when no checksum is available."""
-        # Create a mock model file
-        whisperx_dir = temp_models_dir / "whisperx"
-        whisperx_dir.mkdir(parents=True, exist_ok=True)
-        model_file = whisperx_dir / "base.pt"
-        model_file.write_text("mock model content")
-        
         # Should return True when no checksum is available (development mode)
-        result = model_manager._verify_model_integrity(ModelType.WHISPERX, ModelSize.BASE, model_file)
+        result = model_manager._verify_model_integrity(ModelType.WHISPERX, ModelSize.BASE, whisperx_base_model)
         assert result is True
     
-    def test_clear_model_cache(self, model_manager, temp_models_dir):
+    def test_clear_model_cache(self, model_manager, temp_models_dir, whisperx_base_model):
         """Test clearing model cache."""
-        # Create some mock model files
-        whisperx_dir = temp_models_dir / "whisperx"
-        whisperx_dir.mkdir(parents=True, exist_ok=True)
-        (whisperx_dir / "base.pt").write_text("mock model")
-        
         # Verify files exist
-        assert (whisperx_dir / "base.pt").exists()
+        assert whisperx_base_model.exists()
         
         # Clear cache
         result = model_manager.clear_model_cache()
         
         assert result is True
         assert temp_models_dir.exists()  # Directory should still exist
-        assert not (whisperx_dir / "base.pt").exists()  # Files should be gone
+        assert not whisperx_base_model.exists()  # Files should be gone
     
     def test_set_download_progress_callback(self, model_manager):
         """Test setting download progress callback."""
@@ -154,61 +198,45 @@ class TestModelManager:
         
         assert model_manager._download_progress_callback == callback    
 
-    def test_download_model_integration(self, model_manager):
-        """Test download_model method integration with ModelDownloader."""
-        with patch('src.services.model_downloader.ModelDownloader') as mock_downloader_class:
-            mock_downloader = Mock()
-            mock_downloader_class.return_value = mock_downloader
-            
-            # Mock successful download
-            from src.services.model_downloader import DownloadResult
-            mock_downloader.download_model.return_value = DownloadResult(success=True)
-            
-            result = model_manager.download_model(ModelType.WHISPERX, ModelSize.BASE)
-            
-            assert result is True
-            mock_downloader_class.assert_called_once()
-            mock_downloader.download_model.assert_called_once_with(ModelType.WHISPERX, ModelSize.BASE)
-    
-    def test_download_model_with_progress_callback(self, model_manager):
-        """Test download_model with progress callback."""
-        callback = Mock()
-        model_manager.set_download_progress_callback(callback)
+    @pytest.mark.parametrize("success,error_message,expected,set_callback", [
+        (True, None, True, False),
+        (True, None, True, True),
+        (False, "Network error", False, False),
+    ], ids=["success", "with_progress_callback", "failure"])
+    def test_download_model(self, model_manager, mock_downloader_class, mock_downloader,
+                            success, error_message, expected, set_callback):
+        """Test download_model integration with ModelDownloader."""
+        if set_callback:
+            model_manager.set_download_progress_callback(Mock())
         
-        with patch('src.services.model_downloader.ModelDownloader') as mock_downloader_class:
-            mock_downloader = Mock()
-            mock_downloader_class.return_value = mock_downloader
-            
-            # Mock successful download
-            from src.services.model_downloader import DownloadResult
-            mock_downloader.download_model.return_value = DownloadResult(success=True)
-            
-            result = model_manager.download_model(ModelType.WHISPERX, ModelSize.BASE)
-            
-            assert result is True
-            mock_downloader.set_progress_callback.assert_called_once()
+        mock_downloader.download_model.return_value = DownloadResult(success=success, error_message=error_message)
+        
+        result = model_manager.download_model(ModelType.WHISPERX, ModelSize.BASE)
+        
+        assert result is expected
+        mock_downloader_class.assert_called_once_with(models_dir=model_manager.models_dir)
+        mock_downloader.download_model.assert_called_once_with(ModelType.WHISPERX, ModelSize.BASE)
+        assert mock_downloader.set_progress_callback.called is set_callback
     
-    def test_download_model_failure(self, model_manager):
-        """Test download_model when download fails."""
-        with patch('src.services.model_downloader.ModelDownloader') as mock_downloader_class:
-            mock_downloader = Mock()
-            mock_downloader_class.return_value = mock_downloader
-            
-            # Mock failed download
-            from src.services.model_downloader import DownloadResult
-            mock_downloader.download_model.return_value = DownloadResult(success=False, error_message="Network error")
-            
-            result = model_manager.download_model(ModelType.WHISPERX, ModelSize.BASE)
-            
-            assert result is False
+    def test_download_model_uses_models_dir_override(self, model_manager, temp_models_dir):
+        """Test that download_model writes into the manager's models directory, not the configured one."""
+        async def fake_download_file(url, output_path, resume_from=0, download_key=""):
+            _touch(output_path)
+            return DownloadResult(success=True, file_path=str(output_path))
+        
+        with patch('src.services.model_downloader.config_manager') as mock_config, \
+                patch('src.services.model_downloader.ModelDownloader._check_disk_space_async',
+                      AsyncMock(return_value=True)), \
+                patch('src.services.model_downloader.ModelDownloader._download_file',
+                      AsyncMock(side_effect=fake_download_file)):
+            mock_config.get_config.return_value.models_directory = "/configured_models"
+            assert model_manager.download_model(ModelType.WHISPERX, ModelSize.BASE) is True
+        
+        assert (temp_models_dir / "whisperx" / "base.pt").exists()
+        assert not Path("/configured_models").exists()
     
-    def test_check_required_models(self, model_manager, temp_models_dir):
+    def test_check_required_models(self, model_manager, whisperx_base_model):
         """Test checking required models for application startup."""
-        # Create some mock model files
-        whisperx_dir = temp_models_dir / "whisperx"
-        whisperx_dir.mkdir(parents=True, exist_ok=True)
-        (whisperx_dir / "base.pt").write_text("mock base model")
-        
         required_models = {
             ModelType.WHISPERX: ModelSize.BASE,
             ModelType.DEMUCS: ModelSize.BASE
@@ -221,13 +249,9 @@ class TestModelManager:
         assert results["whisperx_base"] is True
         assert results["demucs_base"] is False
     
-    def test_get_missing_models(self, model_manager, temp_models_dir):
+    def test_get_missing_models(self, model_manager, whisperx_base_model):
         """Test getting list of missing required models."""
-        # Create one model but not the other
-        whisperx_dir = temp_models_dir / "whisperx"
-        whisperx_dir.mkdir(parents=True, exist_ok=True)
-        (whisperx_dir / "base.pt").write_text("mock base model")
-        
+        # Only the whisperx model exists, the demucs one is missing
         required_models = {
             ModelType.WHISPERX: ModelSize.BASE,
             ModelType.DEMUCS: ModelSize.BASE
@@ -249,13 +273,8 @@ class TestModelManager:
         assert model_manager.is_offline_ready(required_models) is False
         
         # Add all required models
-        whisperx_dir = temp_models_dir / "whisperx"
-        whisperx_dir.mkdir(parents=True, exist_ok=True)
-        (whisperx_dir / "base.pt").write_text("mock base model")
-        
-        demucs_dir = temp_models_dir / "demucs"
-        demucs_dir.mkdir(parents=True, exist_ok=True)
-        (demucs_dir / "htdemucs.th").write_text("mock demucs model")
+        _touch(temp_models_dir / "whisperx" / "base.pt")
+        _touch(temp_models_dir / "demucs" / "htdemucs.th")
         
         # Clear cache to force fresh check
         model_manager.invalidate_availability_cache()
@@ -272,14 +291,8 @@ class TestModelManager:
         model_manager.invalidate_availability_cache()
         assert len(model_manager._availability_cache) == 0
     
-    def test_get_model_info(self, model_manager, temp_models_dir):
+    def test_get_model_info(self, model_manager, whisperx_base_model):
         """Test getting comprehensive model information."""
-        # Create a mock model file
-        whisperx_dir = temp_models_dir / "whisperx"
-        whisperx_dir.mkdir(parents=True, exist_ok=True)
-        model_file = whisperx_dir / "base.pt"
-        model_file.write_text("mock model content")
-        
         info = model_manager.get_model_info(ModelType.WHISPERX, ModelSize.BASE)
         
         assert info["type"] == "whisperx"
@@ -305,4 +318,111 @@ class TestModelManager:
             assert "size" in info
             assert "available" in info
             assert "path" in info
-            assert "metadata" in info
\ No newline at end of file
+            assert "metadata" in info
+    
+    def test_get_model_metadata_is_shared_and_read_only(self, model_manager):
+        """Test that model metadata lookups return the shared table entry and cannot be mutated."""
+        first = model_manager.get_model_metadata(ModelType.WHISPERX, ModelSize.BASE)
+        second = model_manager.get_model_metadata(ModelType.WHISPERX, ModelSize.BASE)
+        
+        assert first is second
+        with pytest.raises(TypeError):
+            first["filename"] = "other.pt"
+    
+    def test_get_model_file_path_does_not_create_directory(self, model_manager, temp_models_dir):
+        """Test that resolving a model path has no filesystem side effects."""
+        model_path = model_manager._get_model_file_path(ModelType.WHISPERX, ModelSize.BASE)
+        
+        assert model_path == temp_models_dir / "whisperx" / "base.pt"
+        assert not (temp_models_dir / "whisperx").exists()
+    
+    def test_calculate_file_checksum_without_file_digest(self, model_manager, real_tmp_path, monkeypatch):
+        """Test the memory-mapped and chunked checksum fallbacks used before Python 3.11."""
+        # mmap needs a real file descriptor, so this test runs outside the fake filesystem
+        test_file = _touch(real_tmp_path / "test.bin", b"test content for checksum")
+        empty_file = _touch(real_tmp_path / "empty.bin", b"")
+        
+        monkeypatch.delattr(hashlib, "file_digest", raising=False)
+        
+        assert model_manager._calculate_file_checksum(test_file) == hashlib.sha256(b"test content for checksum").hexdigest()
+        assert model_manager._calculate_file_checksum(empty_file) == hashlib.sha256(b"").hexdigest()
+        assert model_manager._hash_stream(io.BytesIO(b"test content for checksum")) == hashlib.sha256(b"test content for checksum").hexdigest()
+    
+    def test_cached_checksum_skips_rehash_until_file_changes(self, model_manager, temp_models_dir):
+        """Test that the checksum sidecar is reused until the file size or mtime changes."""
+        model_file = _touch(temp_models_dir / "base.pt", b"mock model content")
+        expected = hashlib.sha256(b"mock model content").hexdigest()
+        
+        assert model_manager._get_cached_checksum(model_file, model_file.stat()) == expected
+        assert (temp_models_dir / "base.pt.sha256.json").exists()
+        
+        with patch.object(model_manager, '_calculate_file_checksum') as mock_checksum:
+            assert model_manager._get_cached_checksum(model_file, model_file.stat()) == expected
+            mock_checksum.assert_not_called()
+        
+        # Touch the file with new content and a different mtime to force a re-hash
+        _touch(model_file, b"mock model content v2")
+        file_stat = model_file.stat()
+        os.utime(model_file, ns=(file_stat.st_atime_ns, file_stat.st_mtime_ns + 1_000_000))
+        
+        expected = hashlib.sha256(b"mock model content v2").hexdigest()
+        assert model_manager._get_cached_checksum(model_file, model_file.stat()) == expected
+    
+    def test_cached_checksum_removes_temp_file_on_write_failure(self, model_manager, temp_models_dir):
+        """Test that a failed sidecar write leaves neither a sidecar nor a temporary file."""
+        model_file = _touch(temp_models_dir / "base.pt", b"mock model content")
+        
+        with patch('src.services.model_manager.json.dump', side_effect=OSError("No space left on device")):
+            checksum = model_manager._get_cached_checksum(model_file, model_file.stat())
+        
+        assert checksum == hashlib.sha256(b"mock model content").hexdigest()
+        assert not (temp_models_dir / "base.pt.sha256.json").exists()
+        assert not (temp_models_dir / "base.pt.sha256.json.tmp").exists()
+    
+    def test_list_available_models_probes_once_per_type(self, model_manager):
+        """Test that listing models probes each model type only once."""
+        with patch.object(model_manager, '_check_package_availability', return_value=True) as probe:
+            available = model_manager.list_available_models()
+        
+        assert probe.call_count == len(ModelType)
+        assert available[ModelType.WHISPERX] == frozenset(ModelSize)
+    
+    def test_required_model_checks_share_cached_probes(self, model_manager):
+        """Test that required-model checks reuse cached availability results."""
+        required_models = {
+            ModelType.WHISPERX: ModelSize.BASE,
+            ModelType.DEMUCS: ModelSize.BASE
+        }
+        
+        with patch.object(model_manager, '_check_package_availability', return_value=True) as probe:
+            model_manager.check_required_models(required_models)
+            assert model_manager.get_missing_models(required_models) == []
+            assert model_manager.is_offline_ready(required_models) is True
+        
+        assert probe.call_count == len(required_models)
+    
+    def test_get_model_info_missing_file_has_no_file_details(self, model_manager):
+        """Test that model info omits file details when the model file does not exist."""
+        info = model_manager.get_model_info(ModelType.WHISPERX, ModelSize.BASE)
+        
+        assert info["path"].endswith("base.pt")
+        assert "file_size_bytes" not in info
+        assert "file_size_mb" not in info
+        assert "last_modified" not in info
+    
+    def test_invalidate_availability_cache_clears_package_probes(self, model_manager):
+        """Test that invalidating the cache also forgets the per-type package probes."""
+        model_manager.list_available_models()
+        assert len(model_manager._package_availability) == len(ModelType)
+        
+        model_manager.invalidate_availability_cache()
+        assert model_manager._package_availability == {}
+    
+    def test_clear_model_cache_keeps_models_directory(self, model_manager, temp_models_dir, whisperx_base_model):
+        """Test that clearing the cache empties the models directory without recreating it."""
+        _touch(temp_models_dir / "stray.tmp")
+        root_inode = os.stat(temp_models_dir).st_ino
+        
+        assert model_manager.clear_model_cache() is True
+        assert os.stat(temp_models_dir).st_ino == root_inode
+        assert list(temp_models_dir.iterdir()) == []
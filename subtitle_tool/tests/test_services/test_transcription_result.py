@@ -0,0 +1,49 @@
+"""
+Tests for the TranscriptionResult container.
+
+These tests only need the result class, so they live apart from the
+SpeechRecognizer tests and run without any speech recognition dependencies.
+"""
+
+from src.services.speech_recognizer import TranscriptionResult
+from src.models.data_models import AlignmentData
+
+
+class TestTranscriptionResult:
+    """Test cases for TranscriptionResult class."""
+    
+    def test_success_result(self):
+        """Test creating a successful result."""
+        alignment_data = AlignmentData([], [], [], 0.0)
+        result = TranscriptionResult(
+            success=True,
+            alignment_data=alignment_data,
+            processing_time=10.5
+        )
+        
+        assert result.success is True
+        assert result.alignment_data == alignment_data
+        assert result.error_message is None
+        assert result.processing_time == 10.5
+    
+    def test_error_result(self):
+        """Test creating an error result."""
+        result = TranscriptionResult(
+            success=False,
+            error_message="Recognition failed",
+            processing_time=2.0
+        )
+        
+        assert result.success is False
+        assert result.alignment_data is None
+        assert result.error_message == "Recognition failed"
+        assert result.processing_time == 2.0
+    
+    def test_default_values(self):
+        """Test default values in result."""
+        result = TranscriptionResult(success=True)
+        
+        assert result.success is True
+        assert result.alignment_data is None
+        assert result.error_message is None
+        assert result.processing_time == 0.0
\ No newline at end of file
@@ -5,11 +5,12 @@ This module contains comprehensive tests for vocal separation functionality,
 including success cases, error handling, and progress tracking.
 """
 
+import dataclasses
 import pytest
-import os
-import tempfile
-import shutil
-from unittest.mock import Mock, patch, MagicMock
+import sys
+from collections import namedtuple
+from types import ModuleType
+from unittest.mock import Mock, patch
 from pathlib import Path
 
 from src.services.vocal_separator import VocalSeparator, VocalSeparationResult
@@ -17,28 +18,76 @@ from src.models.data_models import ModelSize
 from src.services.interfaces import ProcessingError
 
 
-class TestVocalSeparator:
-    """Test cases for VocalSeparator class."""
+# Static stand-ins for the psutil result tuples, carrying only the fields the separator reads
+_VirtualMemory = namedtuple("svmem", "available")
+_DiskUsage = namedtuple("sdiskusage", "free")
+
+
+class _FakeProcess:
+    """Process stand-in that counts terminate() calls."""
     
-    def setup_method(self):
-        """Set up test fixtures."""
-        self.temp_dir = tempfile.mkdtemp()
-        self.separator = VocalSeparator(temp_dir=self.temp_dir)
-        
-        # Create a mock audio file
-        self.test_audio_path = os.path.join(self.temp_dir, "test_audio.mp3")
-        with open(self.test_audio_path, 'wb') as f:
-            f.write(b"fake audio data")
+    def __init__(self):
+        self.terminate_calls = 0
+    
+    def terminate(self):
+        self.terminate_calls += 1
+
+
+class _FailingProcess:
+    """Process stand-in whose terminate() always fails."""
+    
+    def terminate(self):
+        raise Exception("Termination failed")
+
+
+@pytest.fixture(scope="module", autouse=True)
+def audio_env(fs_module):
+    """Build the temp directory and mock audio file once per module on the fake filesystem.
     
-    def teardown_method(self):
-        """Clean up test fixtures."""
-        if os.path.exists(self.temp_dir):
-            shutil.rmtree(self.temp_dir)
+    Autouse so every test runs on the fake filesystem whatever order, or
+    pytest-xdist worker, it lands in.
+    """
+    temp_dir = Path("/tmp/vs")
+    temp_dir.mkdir(parents=True, exist_ok=True)
+    audio_path = temp_dir / "test_audio.mp3"
+    audio_path.write_bytes(b"fake audio data")
+    return str(temp_dir), str(audio_path)
+
+
+@pytest.fixture
+def separator(audio_env):
+    """Create a fresh VocalSeparator rooted at the shared temp directory."""
+    return VocalSeparator(temp_dir=audio_env[0])
+
+
+@pytest.fixture
+def work_dir(audio_env, request):
+    """Per-test directory on the fake filesystem; it goes away with the module's fake fs."""
+    path = Path(audio_env[0], request.node.name)
+    path.mkdir()
+    return path
+
+
+@pytest.fixture
+def fake_audio_separator(monkeypatch):
+    """Install a stand-in audio-separator package and return the Separator instance it builds."""
+    separator_instance = Mock()
+    package = ModuleType("audio_separator")
+    package.separator = ModuleType("audio_separator.separator")
+    package.separator.Separator = Mock(return_value=separator_instance)
+    monkeypatch.setitem(sys.modules, "audio_separator", package)
+    monkeypatch.setitem(sys.modules, "audio_separator.separator", package.separator)
+    return separator_instance
+
+
+class TestVocalSeparator:
+    """Test cases for VocalSeparator class."""
     
     def test_init_default_temp_dir(self):
         """Test VocalSeparator initialization with default temp directory."""
-        separator = VocalSeparator()
-        assert separator.temp_dir == tempfile.gettempdir()
+        with patch('tempfile.gettempdir', return_value="/tmp"):
+            separator = VocalSeparator()
+        assert separator.temp_dir == "/tmp"
         assert separator.progress_callback is None
         assert separator._temp_files == []
     
@@ -50,291 +99,261 @@ class TestVocalSeparator:
             assert separator.temp_dir == custom_temp
             mock_makedirs.assert_called_once_with(custom_temp, exist_ok=True)
     
-    def test_set_progress_callback(self):
+    def test_set_progress_callback(self, separator):
         """Test setting progress callback."""
-        callback = Mock()
-        self.separator.set_progress_callback(callback)
-        assert self.separator.progress_callback == callback
+        callback = lambda percentage, message: None
+        separator.set_progress_callback(callback)
+        assert separator.progress_callback == callback
     
-    def test_get_demucs_model_name(self):
+    @pytest.mark.parametrize("model_size,model_name", [
+        (ModelSize.TINY, "mdx_extra_q"),
+        (ModelSize.BASE, "htdemucs"),
+        (ModelSize.SMALL, "htdemucs"),
+        (ModelSize.MEDIUM, "htdemucs_ft"),
+        (ModelSize.LARGE, "mdx_extra"),
+    ])
+    def test_get_demucs_model_name(self, separator, model_size, model_name):
         """Test model name mapping for different sizes."""
-        assert self.separator._get_demucs_model_name(ModelSize.TINY) == "mdx_extra_q"
-        assert self.separator._get_demucs_model_name(ModelSize.BASE) == "htdemucs"
-        assert self.separator._get_demucs_model_name(ModelSize.SMALL) == "htdemucs"
-        assert self.separator._get_demucs_model_name(ModelSize.MEDIUM) == "htdemucs_ft"
-        assert self.separator._get_demucs_model_name(ModelSize.LARGE) == "mdx_extra"
+        assert separator._get_demucs_model_name(model_size) == model_name
     
-    def test_create_temp_output_dir(self):
+    def test_create_temp_output_dir(self, separator, audio_env):
         """Test temporary output directory creation."""
+        temp_dir = audio_env[0]
         with patch('tempfile.mkdtemp') as mock_mkdtemp:
             mock_mkdtemp.return_value = "/fake/temp/dir"
             
-            result = self.separator._create_temp_output_dir()
+            result = separator._create_temp_output_dir()
             
             assert result == "/fake/temp/dir"
-            assert "/fake/temp/dir" in self.separator._temp_files
-            mock_mkdtemp.assert_called_once_with(prefix="demucs_", dir=self.temp_dir)
+            assert "/fake/temp/dir" in separator._temp_files
+            mock_mkdtemp.assert_called_once_with(prefix="demucs_", dir=temp_dir)
     
-    def test_update_progress_with_callback(self):
+    def test_update_progress_with_callback(self, separator):
         """Test progress updates when callback is set."""
-        callback = Mock()
-        self.separator.set_progress_callback(callback)
+        calls = []
+        separator.set_progress_callback(lambda percentage, message: calls.append((percentage, message)))
         
-        self.separator._update_progress(50.0, "Test message")
+        separator._update_progress(50.0, "Test message")
         
-        callback.assert_called_once_with(50.0, "Test message")
+        assert calls == [(50.0, "Test message")]
     
-    def test_update_progress_without_callback(self):
+    def test_update_progress_without_callback(self, separator):
         """Test progress updates when no callback is set."""
         # Should not raise any exception
-        self.separator._update_progress(50.0, "Test message")
+        separator._update_progress(50.0, "Test message")
     
-    def test_get_supported_formats(self):
+    def test_get_supported_formats(self, separator):
         """Test getting supported audio formats."""
-        formats = self.separator.get_supported_formats()
+        formats = separator.get_supported_formats()
         expected_formats = ['.mp3', '.wav', '.flac', '.ogg', '.m4a', '.mp4']
         assert formats == expected_formats
     
-    def test_estimate_processing_time(self):
-        """Test processing time estimation."""
-        # Test with different model sizes
-        duration = 60.0  # 1 minute
-        
-        tiny_time = self.separator.estimate_processing_time(duration, ModelSize.TINY)
-        base_time = self.separator.estimate_processing_time(duration, ModelSize.BASE)
-        large_time = self.separator.estimate_processing_time(duration, ModelSize.LARGE)
-        
-        assert tiny_time == 6.0  # 60 * 0.1
-        assert base_time == 12.0  # 60 * 0.2
-        assert large_time == 30.0  # 60 * 0.5
-        
-        # Tiny should be fastest, large should be slowest
+    @pytest.mark.parametrize("model_size,multiplier", [
+        (ModelSize.TINY, 0.1),
+        (ModelSize.BASE, 0.2),
+        (ModelSize.SMALL, 0.2),
+        (ModelSize.MEDIUM, 0.3),
+        (ModelSize.LARGE, 0.5),
+    ])
+    def test_estimate_processing_time(self, separator, model_size, multiplier):
+        """Test processing time estimation for one minute of audio."""
+        duration = 60.0
+        assert separator.estimate_processing_time(duration, model_size) == pytest.approx(duration * multiplier)
+    
+    def test_estimate_processing_time_ordering(self, separator):
+        """Test that tiny is the fastest model and large the slowest."""
+        tiny_time = separator.estimate_processing_time(60.0, ModelSize.TINY)
+        base_time = separator.estimate_processing_time(60.0, ModelSize.BASE)
+        large_time = separator.estimate_processing_time(60.0, ModelSize.LARGE)
         assert tiny_time < base_time < large_time
     
-    def test_separate_vocals_file_not_found(self):
+    def test_separate_vocals_file_not_found(self, separator):
         """Test vocal separation with non-existent file."""
-        result = self.separator.separate_vocals("/nonexistent/file.mp3")
+        result = separator.separate_vocals("/nonexistent/file.mp3")
         
         assert not result.success
         assert "Input audio file not found" in result.error_message
         assert result.vocals_path is None
     
-    def test_separate_vocals_success(self):
+    def test_separate_vocals_success(self, separator, audio_env, fake_audio_separator):
         """Test successful vocal separation."""
-        # Mock the availability check and separation method
-        with patch.object(self.separator, '_check_demucs_availability'), \
-             patch.object(self.separator, '_run_demucs_separation') as mock_run_demucs:
-            
-            mock_vocals_path = os.path.join(self.temp_dir, "vocals_test_audio.wav")
-            mock_run_demucs.return_value = mock_vocals_path
-            
-            # Create the expected output file
-            with open(mock_vocals_path, 'wb') as f:
-                f.write(b"fake vocals data")
-            
-            # Mock progress callback
-            callback = Mock()
-            self.separator.set_progress_callback(callback)
-            
-            result = self.separator.separate_vocals(self.test_audio_path, ModelSize.BASE)
-            
-            assert result.success
-            assert result.vocals_path == mock_vocals_path
-            assert result.error_message is None
-            assert result.processing_time > 0
-            
-            # Verify Demucs separation was called
-            mock_run_demucs.assert_called_once()
-            
-            # Verify progress callbacks were made
-            assert callback.call_count > 0
+        temp_dir, audio_path = audio_env
+        mock_vocals_path = str(Path(temp_dir, "test_audio_(Vocals).wav"))
+        fake_audio_separator.separate.return_value = [mock_vocals_path]
+        
+        # Create the expected output file
+        Path(mock_vocals_path).write_bytes(b"fake vocals data")
+        
+        # Record progress callbacks
+        calls = []
+        separator.set_progress_callback(lambda percentage, message: calls.append((percentage, message)))
+        
+        result = separator.separate_vocals(audio_path, ModelSize.BASE)
+        
+        assert result.success
+        assert result.vocals_path == mock_vocals_path
+        assert result.error_message is None
+        assert result.processing_time > 0
+        
+        # Verify the separation model was loaded and run on the input file
+        fake_audio_separator.load_model.assert_called_once_with(model_filename="UVR_MDXNET_KARA_2.onnx")
+        fake_audio_separator.separate.assert_called_once_with(audio_path)
+        
+        # Verify progress callbacks were made
+        assert calls[-1] == (100.0, "Vocal separation complete")
     
-    def test_separate_vocals_demucs_import_error(self):
-        """Test vocal separation when Demucs is not installed."""
-        # Mock the availability check to raise ImportError
-        with patch.object(self.separator, '_check_demucs_availability', side_effect=ProcessingError("Demucs is not installed. Please install it with: pip install demucs")):
-            result = self.separator.separate_vocals(self.test_audio_path)
+    def test_separate_vocals_demucs_import_error(self, separator, audio_env, monkeypatch):
+        """Test vocal separation when the audio-separator backend is not installed."""
+        # A None entry makes importing the package fail immediately
+        monkeypatch.setitem(sys.modules, "audio_separator.separator", None)
+        
+        result = separator.separate_vocals(audio_env[1])
         
         assert not result.success
-        assert "Demucs is not installed" in result.error_message
+        assert "Required package 'audio-separator' is not installed" in result.error_message
     
-    def test_separate_vocals_insufficient_stems(self):
-        """Test vocal separation when Demucs returns insufficient stems."""
-        with patch.object(self.separator, '_check_demucs_availability'), \
-             patch.object(self.separator, '_run_demucs_separation', side_effect=ProcessingError("Unexpected number of stems from Demucs separation")):
-            
-            result = self.separator.separate_vocals(self.test_audio_path)
-            
-            assert not result.success
-            assert "Unexpected number of stems" in result.error_message
+    def test_separate_vocals_insufficient_stems(self, separator, audio_env, fake_audio_separator):
+        """Test vocal separation when the separator produces no vocals stem."""
+        fake_audio_separator.separate.return_value = []
+        
+        result = separator.separate_vocals(audio_env[1])
+        
+        assert not result.success
+        assert "vocals file not found" in result.error_message
     
-    def test_separate_vocals_processing_error(self):
+    def test_separate_vocals_processing_error(self, separator, audio_env, fake_audio_separator):
         """Test vocal separation with processing error."""
-        with patch.object(self.separator, '_check_demucs_availability'), \
-             patch.object(self.separator, '_run_demucs_separation', side_effect=ProcessingError("Demucs separation failed: Processing failed")):
-            
-            result = self.separator.separate_vocals(self.test_audio_path)
-            
-            assert not result.success
-            assert "Demucs separation failed" in result.error_message
+        fake_audio_separator.separate.side_effect = RuntimeError("Processing failed")
+        
+        result = separator.separate_vocals(audio_env[1])
+        
+        assert not result.success
+        assert "Vocal separation failed: Processing failed" in result.error_message
     
-    def test_cleanup_temp_files(self):
+    def test_cleanup_temp_files(self, separator, work_dir):
         """Test cleanup of temporary files."""
         # Create some temporary files and directories
-        temp_file = os.path.join(self.temp_dir, "temp_file.txt")
-        temp_subdir = os.path.join(self.temp_dir, "temp_subdir")
-        
-        with open(temp_file, 'w') as f:
-            f.write("test")
-        os.makedirs(temp_subdir)
+        temp_file = work_dir / "temp_file.txt"
+        temp_file.write_bytes(b"test")
+        temp_subdir = work_dir / "temp_subdir"
+        temp_subdir.mkdir()
         
         # Add them to the temp files list
-        self.separator._temp_files = [temp_file, temp_subdir]
+        separator._temp_files = [str(temp_file), str(temp_subdir)]
         
         # Cleanup
-        self.separator.cleanup_temp_files()
+        separator.cleanup_temp_files()
         
         # Verify files are removed
-        assert not os.path.exists(temp_file)
-        assert not os.path.exists(temp_subdir)
-        assert self.separator._temp_files == []
+        assert not temp_file.exists()
+        assert not temp_subdir.exists()
+        assert separator._temp_files == []
     
-    def test_cleanup_temp_files_with_errors(self):
+    def test_cleanup_temp_files_with_errors(self, separator):
         """Test cleanup when some files cannot be removed."""
         # Add non-existent file to temp files list
-        self.separator._temp_files = ["/nonexistent/file.txt"]
+        separator._temp_files = ["/nonexistent/file.txt"]
         
         # Should not raise exception
-        self.separator.cleanup_temp_files()
-        assert self.separator._temp_files == []
+        separator.cleanup_temp_files()
+        assert separator._temp_files == []
     
-    def test_cancel_processing_no_process(self):
+    def test_cancel_processing_no_process(self, separator):
         """Test cancelling when no process is running."""
-        result = self.separator.cancel_processing()
+        result = separator.cancel_processing()
         assert result is True
     
-    def test_cancel_processing_with_process(self):
+    def test_cancel_processing_with_process(self, separator):
         """Test cancelling with active process."""
-        mock_process = Mock()
-        self.separator._current_process = mock_process
+        process = _FakeProcess()
+        separator._current_process = process
         
-        result = self.separator.cancel_processing()
+        result = separator.cancel_processing()
         
         assert result is True
-        mock_process.terminate.assert_called_once()
+        assert process.terminate_calls == 1
     
-    def test_cancel_processing_termination_error(self):
+    def test_cancel_processing_termination_error(self, separator):
         """Test cancelling when process termination fails."""
-        mock_process = Mock()
-        mock_process.terminate.side_effect = Exception("Termination failed")
-        self.separator._current_process = mock_process
+        separator._current_process = _FailingProcess()
         
-        result = self.separator.cancel_processing()
+        result = separator.cancel_processing()
         
         assert result is False
     
-    def test_separate_vocals_empty_file(self):
+    def test_separate_vocals_empty_file(self, separator, audio_env):
         """Test vocal separation with empty input file."""
+        temp_dir = audio_env[0]
         # Create an empty file
-        empty_file = os.path.join(self.temp_dir, "empty.mp3")
-        with open(empty_file, 'wb') as f:
-            pass  # Create empty file
+        empty_file = Path(temp_dir, "empty.mp3")
+        empty_file.touch()
         
-        result = self.separator.separate_vocals(empty_file)
+        result = separator.separate_vocals(str(empty_file))
         
         assert not result.success
         assert "Input audio file is empty" in result.error_message
     
-    def test_check_system_resources_insufficient_memory(self):
-        """Test system resource check with insufficient memory."""
-        with patch('psutil.virtual_memory') as mock_memory:
-            # Mock insufficient memory (1GB available, 4GB required for BASE model)
-            mock_memory.return_value.available = 1 * 1024**3  # 1GB
-            
-            # The method should not raise an exception but log a warning
-            # This is the correct behavior for production robustness
-            with patch('src.services.vocal_separator.logger') as mock_logger:
-                self.separator._check_system_resources(self.test_audio_path, ModelSize.BASE)
-                
-                # Verify warning was logged
-                mock_logger.warning.assert_called()
-                warning_call = mock_logger.warning.call_args[0][0]
-                assert "Insufficient memory" in warning_call
-    
-    def test_check_system_resources_insufficient_disk(self):
-        """Test system resource check with insufficient disk space."""
-        with patch('psutil.virtual_memory') as mock_memory, \
-             patch('psutil.disk_usage') as mock_disk:
-            
-            # Mock sufficient memory but insufficient disk space
-            mock_memory.return_value.available = 8 * 1024**3  # 8GB
-            mock_disk.return_value.free = 0.1 * 1024**3  # 0.1GB
-            
-            # The method should not raise an exception but log a warning
-            with patch('src.services.vocal_separator.logger') as mock_logger:
-                self.separator._check_system_resources(self.test_audio_path, ModelSize.BASE)
-                
-                # Verify warning was logged
-                mock_logger.warning.assert_called()
-                warning_call = mock_logger.warning.call_args[0][0]
-                assert "Insufficient disk space" in warning_call
-    
-    def test_check_system_resources_success(self):
-        """Test successful system resource check."""
-        with patch('psutil.virtual_memory') as mock_memory, \
-             patch('psutil.disk_usage') as mock_disk:
-            
-            # Mock sufficient resources
-            mock_memory.return_value.available = 8 * 1024**3  # 8GB
-            mock_disk.return_value.free = 10 * 1024**3  # 10GB
-            
-            # Should not raise any exception
-            self.separator._check_system_resources(self.test_audio_path, ModelSize.BASE)
+    @pytest.mark.parametrize("memory_gb,disk_gb,warning", [
+        (1, 10, "Insufficient memory"),  # 1GB available, 4GB required for BASE model
+        (8, 0.1, "Insufficient disk space"),
+        (8, 10, None),
+    ])
+    def test_check_system_resources(self, separator, audio_env, memory_gb, disk_gb, warning):
+        """Test the system resource check logs a warning only when resources are short."""
+        # Shortfalls are logged rather than raised, for production robustness
+        with patch('psutil.virtual_memory', return_value=_VirtualMemory(available=memory_gb * 1024**3)), \
+             patch('psutil.disk_usage', return_value=_DiskUsage(free=disk_gb * 1024**3)), \
+             patch('src.services.vocal_separator.logger') as mock_logger:
+            separator._check_system_resources(audio_env[1], ModelSize.BASE)
+        
+        if warning:
+            assert warning in mock_logger.warning.call_args[0][0]
+        else:
+            mock_logger.warning.assert_not_called()
     
-    def test_check_demucs_availability_missing_torch(self):
+    def test_check_demucs_availability_missing_torch(self, separator, monkeypatch):
         """Test Demucs availability check when torch is missing."""
-        with patch('builtins.__import__', side_effect=ImportError("No module named 'torch'")):
-            with pytest.raises(ProcessingError) as exc_info:
-                self.separator._check_demucs_availability()
-            
-            assert "torch" in str(exc_info.value)
-            assert "pip install demucs torch torchaudio" in str(exc_info.value)
+        # Demucs itself is present; a None entry makes importing torch fail immediately
+        demucs = ModuleType("demucs")
+        demucs.api = ModuleType("demucs.api")
+        monkeypatch.setitem(sys.modules, "demucs", demucs)
+        monkeypatch.setitem(sys.modules, "demucs.api", demucs.api)
+        monkeypatch.setitem(sys.modules, "torch", None)
+        
+        with pytest.raises(ProcessingError) as exc_info:
+            separator._check_demucs_availability()
+        
+        assert "Required package 'torch'" in str(exc_info.value)
+        assert "pip install demucs torch torchaudio" in str(exc_info.value)
 
 
 class TestVocalSeparationResult:
     """Test cases for VocalSeparationResult class."""
     
-    def test_success_result(self):
-        """Test creating a successful result."""
-        result = VocalSeparationResult(
-            success=True,
-            vocals_path="/path/to/vocals.wav",
-            processing_time=15.5
-        )
-        
-        assert result.success is True
-        assert result.vocals_path == "/path/to/vocals.wav"
-        assert result.error_message is None
-        assert result.processing_time == 15.5
+    @pytest.mark.parametrize("kwargs,expected", [
+        (  # Successful result
+            {'success': True, 'vocals_path': "/path/to/vocals.wav", 'processing_time': 15.5},
+            {'success': True, 'vocals_path': "/path/to/vocals.wav", 'instrumental_path': None,
+             'error_message': None, 'processing_time': 15.5},
+        ),
+        (  # Error result
+            {'success': False, 'error_message': "Processing failed", 'processing_time': 5.0},
+            {'success': False, 'vocals_path': None, 'instrumental_path': None,
+             'error_message': "Processing failed", 'processing_time': 5.0},
+        ),
+        (  # Default values
+            {'success': True},
+            {'success': True, 'vocals_path': None, 'instrumental_path': None,
+             'error_message': None, 'processing_time': 0.0},
+        ),
+    ])
+    def test_result_fields(self, kwargs, expected):
+        """Test creating results and their default values."""
+        result = VocalSeparationResult(**kwargs)
+        assert dataclasses.asdict(result) == expected
     
-    def test_error_result(self):
-        """Test creating an error result."""
-        result = VocalSeparationResult(
-            success=False,
-            error_message="Processing failed",
-            processing_time=5.0
-        )
-        
-        assert result.success is False
-        assert result.vocals_path is None
-        assert result.error_message == "Processing failed"
-        assert result.processing_time == 5.0
-    
-    def test_default_values(self):
-        """Test default values in result."""
+    def test_result_is_frozen(self):
+        """Test that results cannot be modified after creation."""
         result = VocalSeparationResult(success=True)
-        
-        assert result.success is True
-        assert result.vocals_path is None
-        assert result.error_message is None
-        assert result.processing_time == 0.0
\ No newline at end of file
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            result.success = False
@@ -0,0 +1,24 @@
+"""
+Shared fixtures for the UI tests.
+"""
+
+import pytest
+from unittest.mock import patch
+
+
+@pytest.fixture(scope="session")
+def shared_models_dir(tmp_path_factory):
+    """Models directory for the session, unique per xdist worker."""
+    return tmp_path_factory.mktemp("models")
+
+
+@pytest.fixture(scope="session")
+def all_requirements(shared_models_dir):
+    """Run the real system requirements check once per session; callers must not mutate it."""
+    from src.ui.first_run_wizard import SystemRequirementsChecker
+    from src.utils.config import AppConfig, config_manager
+    
+    # Keep the disk space check out of the user's real models directory
+    config = AppConfig(models_directory=str(shared_models_dir))
+    with patch.object(config_manager, 'get_config', return_value=config):
+        return SystemRequirementsChecker.check_all_requirements()
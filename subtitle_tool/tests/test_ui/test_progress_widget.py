@@ -8,25 +8,20 @@ including real-time updates, cancellation support, and time estimation.
 import pytest
 import time
 from unittest.mock import Mock, patch
-from PyQt6.QtWidgets import QApplication
 from PyQt6.QtCore import QTimer
 from PyQt6.QtTest import QTest
 
-from src.ui.progress_widget import ProgressWidget
+from src.ui.progress_widget import MAX_PROGRESS_HISTORY, ProgressWidget
 
 
 class TestProgressWidget:
     """Test cases for ProgressWidget functionality."""
     
     @pytest.fixture
-    def app(self):
-        """Create QApplication instance for testing."""
-        return QApplication.instance() or QApplication([])
-    
-    @pytest.fixture
-    def progress_widget(self, app):
+    def progress_widget(self, qtbot):
         """Create a ProgressWidget instance for testing."""
         widget = ProgressWidget()
+        qtbot.addWidget(widget)
         return widget
     
     def test_initial_state(self, progress_widget):
@@ -187,41 +182,41 @@ class TestProgressWidget:
         
     def test_progress_signals(self, progress_widget):
         """Test that progress signals are emitted correctly."""
-        progress_updated_signal = Mock()
-        cancel_requested_signal = Mock()
+        emitted = []
+        cancel_requests = []
         
-        progress_widget.progress_updated.connect(progress_updated_signal)
-        progress_widget.cancel_requested.connect(cancel_requested_signal)
+        progress_widget.progress_updated.connect(lambda p, m: emitted.append((p, m)))
+        progress_widget.cancel_requested.connect(lambda: cancel_requests.append(True))
         
         progress_widget.start_processing()
         progress_widget.update_progress(25.0, "Test message")
         
         # Check progress signal
-        progress_updated_signal.assert_called_once_with(25.0, "Test message")
+        assert emitted == [(25.0, "Test message")]
         
         # Test cancel signal
         progress_widget._on_cancel_clicked()
-        cancel_requested_signal.assert_called_once()
+        assert cancel_requests == [True]
         
     def test_progress_history_management(self, progress_widget):
         """Test that progress history is managed correctly."""
         progress_widget.start_processing()
         
         # Add multiple progress updates
-        for i in range(10):
-            progress_widget.update_progress(i * 10, f"Step {i}")
+        now = time.time()
+        progress_widget.bulk_update_progress([(now, i * 10, f"Step {i}") for i in range(10)])
             
         assert len(progress_widget._progress_history) == 10
         
-        # Test that old entries are cleaned up (simulate old timestamps)
-        old_time = time.time() - 700  # 11+ minutes ago
-        progress_widget._progress_history[0]['time'] = old_time
-        
-        # Add new entry to trigger cleanup
+        # History is bounded; the oldest entries are evicted first
+        progress_widget.bulk_update_progress(
+            [(now, 50.0, f"Extra {i}") for i in range(MAX_PROGRESS_HISTORY)]
+        )
         progress_widget.update_progress(100.0, "Final step")
         
-        # Old entry should be removed
-        assert all(entry['time'] > time.time() - 600 for entry in progress_widget._progress_history)
+        assert len(progress_widget._progress_history) <= MAX_PROGRESS_HISTORY
+        assert progress_widget._progress_history[0]['message'] == "Extra 1"
+        assert progress_widget._progress_history[-1]['message'] == "Final step"
         
     def test_time_formatting(self, progress_widget):
         """Test duration formatting."""
@@ -234,15 +229,14 @@ class TestProgressWidget:
         
     def test_progress_info(self, progress_widget):
         """Test getting progress information."""
-        progress_widget.start_processing(estimated_total_time=100.0)
-        
-        # Add a small delay to ensure elapsed time > 0
-        import time
-        time.sleep(0.01)
-        
-        progress_widget.update_progress(50.0, "Halfway", "Test Operation", 75.0)
-        
-        info = progress_widget.get_progress_info()
+        with patch('src.ui.progress_widget.time.time') as mock_time:
+            mock_time.return_value = 1000.0
+            progress_widget.start_processing(estimated_total_time=100.0)
+            
+            mock_time.return_value = 1000.5
+            progress_widget.update_progress(50.0, "Halfway", "Test Operation", 75.0)
+            
+            info = progress_widget.get_progress_info()
         
         assert info['overall_progress'] == 50.0
         assert info['operation_progress'] == 75.0
@@ -251,13 +245,12 @@ class TestProgressWidget:
         assert info['is_processing'] == True
         assert info['estimated_total_time'] == 100.0
         assert info['updates_count'] == 1
-        assert info['elapsed_time'] >= 0  # Changed to >= since it might be very small
+        assert info['elapsed_time'] == 0.5
         
-    def test_details_toggle(self, progress_widget):
+    def test_details_toggle(self, qtbot, progress_widget):
         """Test showing/hiding details section."""
-        # Show the widget to ensure proper layout
         progress_widget.show()
-        QApplication.processEvents()
+        qtbot.waitExposed(progress_widget)
         
         # Initially hidden
         assert not progress_widget.details_group.isVisible()
@@ -265,16 +258,12 @@ class TestProgressWidget:
         
         # Show details
         progress_widget._toggle_details()
-        # Process events to ensure UI updates
-        QApplication.processEvents()
-        assert progress_widget.details_group.isVisible()
+        qtbot.waitUntil(lambda: progress_widget.details_group.isVisible(), timeout=1000)
         assert progress_widget.details_button.text() == "Hide Details"
         
         # Hide details
         progress_widget._toggle_details()
-        # Process events to ensure UI updates
-        QApplication.processEvents()
-        assert not progress_widget.details_group.isVisible()
+        qtbot.waitUntil(lambda: not progress_widget.details_group.isVisible(), timeout=1000)
         assert progress_widget.details_button.text() == "Show Details"
         
     def test_progress_log(self, progress_widget):